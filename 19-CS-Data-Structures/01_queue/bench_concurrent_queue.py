@@ -0,0 +1,72 @@
+"""Measure ConcurrentQueue throughput under thread contention, against
+a Queue guarded by one global lock.
+
+Run with `python3 bench_concurrent_queue.py [n_items]`.
+"""
+import sys
+import threading
+import time
+
+from queue import Queue
+from concurrent_queue import ConcurrentQueue
+
+
+class LockedQueue:
+    """The coarse baseline: every put and get takes the same lock."""
+    def __init__(self, maxsize=0):
+        self.maxsize = maxsize
+        self.queue = Queue()
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+
+    def put(self, item):
+        with self.lock:
+            while self.maxsize > 0 and self.queue.len() >= self.maxsize:
+                self.not_full.wait()
+            self.queue.enqueue(item)
+            self.not_empty.notify()
+
+    def get(self):
+        with self.lock:
+            while not self.queue.len():
+                self.not_empty.wait()
+            item = self.queue.dequeue()
+            self.not_full.notify()
+            return item
+
+
+def throughput(queue_class, n_threads, n_items, maxsize=1024):
+    """Items per second moved by n_threads producers and n_threads
+    consumers sharing one bounded queue."""
+    q = queue_class(maxsize)
+    per_thread = n_items // n_threads
+
+    def produce():
+        for i in range(per_thread):
+            q.put(i)
+
+    def consume():
+        for _ in range(per_thread):
+            q.get()
+
+    threads = [threading.Thread(target=produce) for _ in range(n_threads)]
+    threads += [threading.Thread(target=consume) for _ in range(n_threads)]
+
+    start_time = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start_time
+
+    return per_thread * n_threads / elapsed
+
+
+if __name__ == '__main__':
+    n_items = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    print(f"{'threads':>7} {'LockedQueue':>14} {'ConcurrentQueue':>16}")
+    for n_threads in (1, 2, 4, 8, 16):
+        locked = throughput(LockedQueue, n_threads, n_items)
+        concurrent = throughput(ConcurrentQueue, n_threads, n_items)
+        print(f"{n_threads:>7} {locked:>12,.0f}/s {concurrent:>14,.0f}/s")
@@ -0,0 +1,61 @@
+"""Compare Queue storage engines.
+
+Run with `python3 bench_queue.py [n_ops ...]`, e.g.
+`python3 bench_queue.py 1000000 10000000`.
+"""
+import sys
+import time
+
+from queue import Queue, LinkedList, ArrayDeque
+
+
+ENGINES = {
+    'LinkedList': LinkedList,
+    'ArrayDeque': ArrayDeque,
+}
+
+
+def fill_then_drain(engine, n):
+    """n/2 enqueues followed by n/2 dequeues"""
+    q = Queue(engine())
+    for i in range(n // 2):
+        q.enqueue(i)
+    for _ in range(n // 2):
+        q.dequeue()
+
+
+def steady_state(engine, n):
+    """interleaved enqueue/dequeue on a queue holding ~1000 items"""
+    q = Queue(engine())
+    for i in range(1000):
+        q.enqueue(i)
+    for i in range(n // 2):
+        q.enqueue(i)
+        q.dequeue()
+
+
+def batch_handoff(engine, n, batch=1000):
+    """n/2 items passed through two pipeline stages in batches"""
+    producer, consumer = Queue(engine()), Queue(engine())
+    for start in range(0, n // 2, batch):
+        producer.enqueue_many(range(start, start + batch))
+        consumer.enqueue_many(producer)
+        consumer.dequeue_many(batch)
+
+
+def run(n_ops):
+    for workload in (fill_then_drain, steady_state, batch_handoff):
+        for name, engine in ENGINES.items():
+            start_time = time.perf_counter()
+            workload(engine, n_ops)
+            elapsed = time.perf_counter() - start_time
+            print(
+                f"{workload.__name__:<16} {name:<11} {n_ops:>10,} ops "
+                f"{elapsed:8.3f}s {n_ops / elapsed:14,.0f} ops/s"
+            )
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10 ** 6]
+    for n_ops in sizes:
+        run(n_ops)
@@ -0,0 +1,181 @@
+import asyncio
+import importlib.util
+import os
+import threading
+
+
+def _load_queue_engine():
+    # queue.py shares its name with the standard library module that
+    # concurrent.futures imports (and with it asyncio.to_thread and
+    # loop.getaddrinfo), so load it under another name instead of
+    # letting it take over sys.modules['queue']
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'queue.py')
+    spec = importlib.util.spec_from_file_location('queue_engine', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+_queue_engine = _load_queue_engine()
+Node, LinkedList = _queue_engine.Node, _queue_engine.LinkedList
+
+
+class Empty(Exception):
+    """Raised by a non-blocking or timed-out get on an empty queue."""
+
+
+class Full(Exception):
+    """Raised by a non-blocking or timed-out put on a full queue."""
+
+
+class ConcurrentQueue:
+    """Bounded, thread-safe FIFO queue.
+
+    Producers and consumers take separate locks: producers only touch the
+    tail and consumers only touch the head, which always points at a dummy
+    node so the two ends never share a node. A maxsize of 0 means the queue
+    is unbounded.
+
+    The split only pays off where a put and a get can really run at the
+    same time, as on a free-threaded build. Under the GIL they take turns
+    anyway, and the extra lock handoffs make this queue slower than one
+    global lock (see bench_concurrent_queue.py); use it there for the
+    blocking put/get with timeouts, not for throughput.
+    """
+    def __init__(self, maxsize=0):
+        self.maxsize = maxsize
+        self.head = self.tail = Node()  # dummy node, its value is unused
+        # each counter is only written under its own lock, so size
+        # needs no lock shared by both ends
+        self._puts = 0
+        self._gets = 0
+
+        self._put_lock = threading.Lock()
+        self._get_lock = threading.Lock()
+        self._not_full = threading.Condition(self._put_lock)
+        self._not_empty = threading.Condition(self._get_lock)
+
+    @property
+    def size(self):
+        return self._puts - self._gets
+
+    def _has_room(self):
+        return self._puts - self._gets < self.maxsize
+
+    def _has_items(self):
+        return self._puts != self._gets
+
+    def put(self, item, block=True, timeout=None):
+        new_node = Node(item)
+
+        with self._not_full:
+            # go through wait_for only when we may actually block
+            if self.maxsize > 0 and not self._has_room() and not self._wait(
+                    self._not_full, self._has_room, block, timeout):
+                raise Full
+
+            self.tail.set_next(new_node)
+            self.tail = new_node
+            # publish our own count before reading the other one, so a
+            # consumer that has just found the queue empty is seen here
+            self._puts += 1
+            previous_size = self._puts - 1 - self._gets
+
+            # wake another producer if there is still room
+            if self.maxsize > 0 and previous_size + 1 < self.maxsize:
+                self._not_full.notify()
+
+        # consumers can only be waiting if the queue was empty
+        if previous_size == 0:
+            with self._not_empty:
+                self._not_empty.notify()
+
+    def get(self, block=True, timeout=None):
+        with self._not_empty:
+            if self._puts == self._gets and not self._wait(
+                    self._not_empty, self._has_items, block, timeout):
+                raise Empty
+
+            # the first real node becomes the new dummy
+            first = self.head.get_next()
+            self.head = first
+            item = first.value
+            first.value = None
+            self._gets += 1
+            previous_size = self._puts - self._gets + 1
+
+            # wake another consumer if items remain
+            if previous_size > 1:
+                self._not_empty.notify()
+
+        # producers can only be waiting if the queue was full
+        if previous_size == self.maxsize:
+            with self._not_full:
+                self._not_full.notify()
+
+        return item
+
+    def put_nowait(self, item):
+        self.put(item, block=False)
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+    def len(self):
+        return self._puts - self._gets
+
+    @staticmethod
+    def _wait(condition, predicate, block, timeout):
+        if not block:
+            return False  # the caller already found predicate false
+        return condition.wait_for(predicate, timeout)
+
+
+class AsyncQueue:
+    """Bounded FIFO queue for asyncio coroutines, stored in a LinkedList.
+
+    `put` waits while the queue is full and `get` waits while it is empty;
+    both raise Full/Empty if `timeout` seconds pass first. A maxsize of 0
+    means the queue is unbounded.
+    """
+    def __init__(self, maxsize=0):
+        self.maxsize = maxsize
+        self.storage = LinkedList()
+
+        self._lock = asyncio.Lock()
+        self._not_full = asyncio.Condition(self._lock)
+        self._not_empty = asyncio.Condition(self._lock)
+
+    async def put(self, item, timeout=None):
+        async with self._lock:
+            if self.maxsize > 0:
+                await self._wait(
+                    self._not_full,
+                    lambda: len(self.storage) < self.maxsize,
+                    timeout, Full)
+
+            self.storage.add_to_tail(item)
+            self._not_empty.notify()
+
+    async def get(self, timeout=None):
+        async with self._lock:
+            await self._wait(self._not_empty, lambda: len(self.storage) > 0,
+                             timeout, Empty)
+
+            item = self.storage.pop_head()
+            self._not_full.notify()
+            return item
+
+    def len(self):
+        return len(self.storage)
+
+    @staticmethod
+    async def _wait(condition, predicate, timeout, error):
+        if timeout is None:
+            await condition.wait_for(predicate)
+            return
+
+        try:
+            await asyncio.wait_for(condition.wait_for(predicate), timeout)
+        except asyncio.TimeoutError:
+            raise error from None
@@ -1,19 +1,55 @@
+import sys
+
+
 class Queue:
-    def __init__(self):
+    def __init__(self, storage=None):
         self.size = 0
         # what data structure should we
         # use to store queue elements?
-        self.storage = LinkedList()
+        # any empty engine with `add_to_tail` and `pop_head` works,
+        # e.g. Queue(ArrayDeque()) for large queues
+        self.storage = storage if storage is not None else LinkedList()
 
     def enqueue(self, item):
         self.storage.add_to_tail(item)
         self.size += 1
 
     def dequeue(self):
-        item = self.storage.pop_head() # popping from head is easier than tail
-        if item:
+        if not self.size:
+            return None
+        self.size -= 1
+        return self.storage.pop_head() # popping from head is easier than tail
+
+    def enqueue_many(self, items):
+        """Enqueue every item from an iterable. Passing another Queue
+        hands over its whole contents, which leaves it empty; with
+        LinkedList storage on both sides that is a single O(1) splice.
+        Enqueueing a queue into itself does nothing."""
+        if items is self:
+            return
+        if isinstance(items, Queue):
+            self.storage.splice(items.storage)
+            self.size += items.size
+            items.size = 0
+        else:
+            self.size += self.storage.extend(items)
+
+    def dequeue_many(self, n):
+        """Dequeue up to n items and return them as a list,
+        oldest first."""
+        items = self.storage.pop_many(max(0, min(n, self.size)))
+        self.size -= len(items)
+        return items
+
+    def drain(self):
+        """Consuming generator: yields items oldest first, removing
+        each one from the queue as it goes."""
+        while self.size:
             self.size -= 1
-        return item
+            yield self.storage.pop_head()
+
+    def contains(self, item):
+        return self.storage.contains(item)
 
     def len(self):
         return self.size
@@ -41,13 +77,24 @@ class Node:
 
 
 class LinkedList:
-    def __init__(self):
+    def __init__(self, index=False):
         self.head = None
         self.tail = None
+        self.length = 0
+        # optional value -> count map that makes `contains` O(1)
+        # at the cost of one dict entry per distinct (hashable) value
+        self.index = {} if index else None
+
+    def __len__(self):
+        return self.length
 
     # methods to add to list
     def add_to_tail(self, value):
+        # index first: an unhashable value raises before anything changes
+        if self.index is not None:
+            self._index_add(value)
         new_node = Node(value)
+        self.length += 1
 
         if not self.head:  # so we can first add to head/tail
             self.head = new_node
@@ -56,8 +103,60 @@ class LinkedList:
             self.tail.set_next(new_node)
             self.tail = new_node
 
+    def extend(self, values):
+        """Build a chain from values off to the side, then link it to
+        the tail in one step. Returns the number of values added."""
+        first = last = None
+        count = 0
+        for value in values:
+            new_node = Node(value)
+            if last is None:
+                first = new_node
+            else:
+                last.next_node = new_node
+            last = new_node
+            count += 1
+
+        if first is not None:
+            if self.index is not None:
+                self._index_chain(first)
+            self._link_chain(first, last, count)
+        return count
+
+    def splice(self, other):
+        """Move every node of another LinkedList to the end of this
+        one in O(1). The other list is left empty."""
+        if other is self:
+            return
+        if not isinstance(other, LinkedList):  # e.g. an ArrayDeque
+            self.extend(other.drain())
+        elif other.head is not None:
+            if self.index is not None:
+                if other.index is not None:
+                    for value, count in other.index.items():
+                        self._index_add(value, count)
+                else:
+                    self._index_chain(other.head)
+            other.index = {} if other.index is not None else None
+            self._link_chain(other.head, other.tail, other.length)
+            other.head = None
+            other.tail = None
+            other.length = 0
+
+    def _link_chain(self, first, last, count):
+        if not self.head:
+            self.head = first
+        else:
+            self.tail.set_next(first)
+        self.tail = last
+        self.length += count
+
     def add_to_head(self, value):
+        # index first: an unhashable value raises before anything changes
+        if self.index is not None:
+            self._index_add(value)
         new_node = Node(value)
+        self.length += 1
 
         if not self.head:  # so we can first add to head/tail
             self.head = new_node
@@ -69,6 +168,9 @@ class LinkedList:
 
     # method to find in list
     def contains(self, value):
+        if self.index is not None:
+            return value in self.index
+
         if not self.head:  # if no head, list is empty, cannot contain our v
             return False
 
@@ -81,11 +183,199 @@ class LinkedList:
 
         return False
 
-    # method to remove from list
+    # methods to remove from list
     def pop_head(self):
         if not self.head:
             return None
         else:
             temp_node = self.head
             self.head = self.head.get_next()
+            self.length -= 1
+            if not self.head:
+                self.tail = None
+            if self.index is not None:
+                self._index_remove(temp_node.value)
             return temp_node.value
+
+    def pop_many(self, n):
+        """Unlink up to n nodes from the head in one cut and return
+        their values as a list."""
+        values = []
+        current = self.head
+        while current and len(values) < n:
+            values.append(current.value)
+            current = current.next_node
+
+        self.head = current
+        self.length -= len(values)
+        if not current:
+            self.tail = None
+        if self.index is not None:
+            for value in values:
+                self._index_remove(value)
+        return values
+
+    def drain(self):
+        """Consuming generator over the values, head first."""
+        while self.head:
+            yield self.pop_head()
+
+    # membership index bookkeeping
+    def _index_add(self, value, count=1):
+        self.index[value] = self.index.get(value, 0) + count
+
+    def _index_chain(self, first):
+        """Index the values of first and every node after it, or, if
+        one of them can't be indexed, none of them."""
+        current = first
+        try:
+            while current is not None:
+                self._index_add(current.value)
+                current = current.next_node
+        except BaseException:
+            added = first
+            while added is not current:
+                self._index_remove(added.value)
+                added = added.next_node
+            raise
+
+    def _index_remove(self, value):
+        count = self.index[value]
+        if count == 1:
+            del self.index[value]
+        else:
+            self.index[value] = count - 1
+
+    def memory_usage(self):
+        """Approximate bytes used by the nodes and by the membership
+        index (values themselves are not counted), to judge whether
+        the index pays off for a given queue."""
+        sample = Node()
+        node_bytes = sys.getsizeof(sample) + sys.getsizeof(sample.__dict__)
+        index_bytes = 0
+        if self.index is not None:
+            index_bytes = sys.getsizeof(self.index)
+        return {
+            'nodes': self.length * node_bytes,
+            'index': index_bytes,
+        }
+
+
+class ArrayDeque:
+    """Growable circular array with the same add/pop interface as
+    LinkedList. Capacity doubles when full and halves when the deque
+    drains to a quarter full, so every operation is amortized O(1)
+    and no per-item node is allocated."""
+    MIN_CAPACITY = 8
+
+    def __init__(self, capacity=MIN_CAPACITY):
+        capacity = max(capacity, self.MIN_CAPACITY)
+        self.storage = [None] * capacity
+        self.head = 0  # index of the first item
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    def _resize(self, capacity):
+        # unroll the ring so the first item lands at index 0
+        old = self.storage
+        end = self.head + self.length
+        items = old[self.head:end] + old[:max(0, end - len(old))]
+        self.storage = items + [None] * (capacity - self.length)
+        self.head = 0
+
+    # methods to add to deque
+    def add_to_tail(self, value):
+        capacity = len(self.storage)
+        if self.length == capacity:
+            self._resize(capacity * 2)
+            capacity *= 2
+
+        self.storage[(self.head + self.length) % capacity] = value
+        self.length += 1
+
+    def add_to_head(self, value):
+        capacity = len(self.storage)
+        if self.length == capacity:
+            self._resize(capacity * 2)
+            capacity *= 2
+
+        self.head = (self.head - 1) % capacity
+        self.storage[self.head] = value
+        self.length += 1
+
+    # method to find in deque
+    def contains(self, value):
+        capacity = len(self.storage)
+        for i in range(self.length):
+            if self.storage[(self.head + i) % capacity] == value:
+                return True
+
+        return False
+
+    def extend(self, values):
+        """Add every value to the tail, growing at most once when the
+        size of values is known. Returns the number of values added."""
+        if hasattr(values, '__len__'):
+            needed = self.length + len(values)
+            capacity = len(self.storage)
+            if needed > capacity:
+                while capacity < needed:
+                    capacity *= 2
+                self._resize(capacity)
+
+        count = 0
+        for value in values:
+            self.add_to_tail(value)
+            count += 1
+        return count
+
+    def splice(self, other):
+        """Move every value of another storage engine to the tail.
+        The other engine is left empty."""
+        if other is self:
+            return
+        self.extend(list(other.drain()))
+
+    # methods to remove from deque
+    def pop_head(self):
+        if not self.length:
+            return None
+
+        capacity = len(self.storage)
+        value = self.storage[self.head]
+        self.storage[self.head] = None  # drop the reference for the gc
+        self.head = (self.head + 1) % capacity
+        self.length -= 1
+
+        if capacity > self.MIN_CAPACITY and self.length <= capacity // 4:
+            self._resize(capacity // 2)
+
+        return value
+
+    def pop_many(self, n):
+        """Remove up to n values from the head and return them
+        as a list."""
+        n = max(0, min(n, self.length))
+        end = self.head + n
+        capacity = len(self.storage)
+        values = self.storage[self.head:end]
+        if end > capacity:
+            values += self.storage[:end - capacity]
+        for i in range(n):
+            self.storage[(self.head + i) % capacity] = None
+
+        self.head = end % capacity
+        self.length -= n
+        while capacity > self.MIN_CAPACITY and self.length <= capacity // 4:
+            capacity //= 2
+        if capacity != len(self.storage):
+            self._resize(capacity)
+
+        return values
+
+    def drain(self):
+        """Consuming generator over the values, head first."""
+        while self.length:
+            yield self.pop_head()
@@ -0,0 +1,126 @@
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from concurrent_queue import ConcurrentQueue, AsyncQueue, Empty, Full
+
+class ConcurrentQueueTests(unittest.TestCase):
+  def setUp(self):
+    self.q = ConcurrentQueue(maxsize=3)
+
+  def test_put_get_respects_order(self):
+    self.q.put(1)
+    self.q.put(0)
+    self.q.put(None)
+    self.assertEqual(self.q.len(), 3)
+    self.assertEqual(self.q.get(), 1)
+    self.assertEqual(self.q.get(), 0)
+    self.assertIsNone(self.q.get())
+    self.assertEqual(self.q.len(), 0)
+
+  def test_nonblocking_raises(self):
+    self.assertRaises(Empty, self.q.get_nowait)
+    for i in range(3):
+      self.q.put_nowait(i)
+    self.assertRaises(Full, self.q.put_nowait, 3)
+
+  def test_timeouts_raise(self):
+    self.assertRaises(Empty, self.q.get, timeout=0.01)
+    for i in range(3):
+      self.q.put(i)
+    self.assertRaises(Full, self.q.put, 3, timeout=0.01)
+
+  def test_put_blocks_until_get(self):
+    for i in range(3):
+      self.q.put(i)
+    producer = threading.Thread(target=self.q.put, args=(3,))
+    producer.start()
+    producer.join(0.05)
+    self.assertTrue(producer.is_alive())
+    self.assertEqual(self.q.get(), 0)
+    producer.join(1)
+    self.assertFalse(producer.is_alive())
+    self.assertEqual([self.q.get() for _ in range(3)], [1, 2, 3])
+
+  def test_many_producers_and_consumers(self):
+    n_threads, n_items = 4, 500
+    results = []
+    results_lock = threading.Lock()
+
+    def produce(offset):
+      for i in range(n_items):
+        self.q.put(offset + i)
+
+    def consume():
+      items = [self.q.get(timeout=5) for _ in range(n_items)]
+      with results_lock:
+        results.extend(items)
+
+    threads = [threading.Thread(target=produce, args=(t * n_items,))
+               for t in range(n_threads)]
+    threads += [threading.Thread(target=consume) for _ in range(n_threads)]
+    for thread in threads:
+      thread.start()
+    for thread in threads:
+      thread.join()
+
+    self.assertEqual(sorted(results), list(range(n_threads * n_items)))
+    self.assertEqual(self.q.len(), 0)
+
+class AsyncQueueTests(unittest.TestCase):
+  def test_put_get_respects_order(self):
+    async def run():
+      q = AsyncQueue()
+      for i in range(5):
+        await q.put(i)
+      self.assertEqual(q.len(), 5)
+      return [await q.get() for _ in range(5)]
+
+    self.assertEqual(asyncio.run(run()), [0, 1, 2, 3, 4])
+
+  def test_timeouts_raise(self):
+    async def run():
+      q = AsyncQueue(maxsize=1)
+      with self.assertRaises(Empty):
+        await q.get(timeout=0.01)
+      await q.put(1)
+      with self.assertRaises(Full):
+        await q.put(2, timeout=0.01)
+      self.assertEqual(await q.get(), 1)
+
+    asyncio.run(run())
+
+  def test_bounded_producer_consumer(self):
+    async def run():
+      q = AsyncQueue(maxsize=2)
+
+      async def produce():
+        for i in range(50):
+          await q.put(i)
+
+      async def consume():
+        return [await q.get() for _ in range(50)]
+
+      _, items = await asyncio.gather(produce(), consume())
+      return items
+
+    self.assertEqual(asyncio.run(run()), list(range(50)))
+
+class ImportTests(unittest.TestCase):
+  def test_import_leaves_stdlib_queue_alone(self):
+    # run from elsewhere, so only the import itself could shadow queue
+    script = (
+      "import sys; sys.path.append(%r)\n"
+      "import asyncio, concurrent_queue\n"
+      "print(asyncio.run(asyncio.to_thread(lambda: 'ok')))\n"
+    ) % os.path.dirname(os.path.abspath(__file__))
+    with tempfile.TemporaryDirectory() as cwd:
+      result = subprocess.run([sys.executable, '-c', script], cwd=cwd,
+                              capture_output=True, text=True)
+    self.assertEqual(result.stdout.strip(), 'ok', result.stderr)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -1,5 +1,7 @@
 import unittest
 from queue import Queue
+from queue import ArrayDeque
+from queue import LinkedList
 
 class QueueTests(unittest.TestCase):
   def setUp(self):
@@ -40,6 +42,200 @@ class QueueTests(unittest.TestCase):
     self.assertIsNone(self.q.dequeue())
     self.assertEqual(self.q.len(), 0)
 
+  def test_dequeue_returns_falsy_items(self):
+    self.q.enqueue(0)
+    self.q.enqueue('')
+    self.assertEqual(self.q.dequeue(), 0)
+    self.assertEqual(self.q.len(), 1)
+    self.assertEqual(self.q.dequeue(), '')
+    self.assertEqual(self.q.len(), 0)
+
+  def test_enqueue_many(self):
+    self.q.enqueue(1)
+    self.q.enqueue_many([2, 3, 4])
+    self.q.enqueue_many(iter([]))
+    self.q.enqueue_many(x for x in (5, 6))
+    self.assertEqual(self.q.len(), 6)
+    self.assertEqual(self.q.dequeue_many(10), [1, 2, 3, 4, 5, 6])
+    self.assertEqual(self.q.len(), 0)
+    self.assertIsNone(self.q.dequeue())
+
+  def test_enqueue_many_splices_other_queue(self):
+    other = Queue()
+    other.enqueue_many(range(3, 6))
+    self.q.enqueue_many(range(3))
+    self.q.enqueue_many(other)
+    self.assertEqual(other.len(), 0)
+    self.assertIsNone(other.dequeue())
+    self.assertEqual(self.q.len(), 6)
+    self.q.enqueue(6)
+    self.assertEqual(list(self.q.drain()), list(range(7)))
+
+  def test_enqueue_many_into_itself_is_a_no_op(self):
+    self.q.enqueue_many(range(3))
+    self.q.enqueue_many(self.q)
+    self.assertEqual(self.q.len(), 3)
+    self.q.storage.splice(self.q.storage)
+    self.assertEqual(len(self.q.storage), 3)
+    self.assertEqual(list(self.q.drain()), [0, 1, 2])
+
+  def test_enqueue_many_from_array_queue(self):
+    other = Queue(ArrayDeque())
+    other.enqueue_many(range(4))
+    self.q.enqueue_many(other)
+    self.assertEqual(other.len(), 0)
+    self.assertEqual(self.q.dequeue_many(5), [0, 1, 2, 3])
+
+  def test_dequeue_many(self):
+    self.q.enqueue_many(range(10))
+    self.assertEqual(self.q.dequeue_many(3), [0, 1, 2])
+    self.assertEqual(self.q.len(), 7)
+    self.assertEqual(self.q.dequeue_many(0), [])
+    self.assertEqual(self.q.dequeue(), 3)
+    self.assertEqual(self.q.dequeue_many(100), [4, 5, 6, 7, 8, 9])
+    self.assertEqual(self.q.dequeue_many(1), [])
+    self.q.enqueue(10)
+    self.assertEqual(self.q.dequeue(), 10)
+
+  def test_dequeue_many_negative_count(self):
+    self.q.enqueue_many(range(3))
+    self.assertEqual(self.q.dequeue_many(-1), [])
+    self.assertEqual(self.q.len(), 3)
+    self.assertEqual(self.q.storage.pop_many(-2), [])
+    self.assertEqual(list(self.q.drain()), [0, 1, 2])
+
+  def test_drain_is_lazy(self):
+    self.q.enqueue_many(range(5))
+    drain = self.q.drain()
+    self.assertEqual(next(drain), 0)
+    self.assertEqual(next(drain), 1)
+    self.assertEqual(self.q.len(), 3)
+    self.assertEqual(list(drain), [2, 3, 4])
+    self.assertEqual(self.q.len(), 0)
+
+  def test_contains(self):
+    self.q.enqueue_many(['a', 'b', 'a'])
+    self.assertTrue(self.q.contains('a'))
+    self.assertFalse(self.q.contains('c'))
+    self.q.dequeue()
+    self.assertTrue(self.q.contains('a'))
+    self.q.dequeue_many(2)
+    self.assertFalse(self.q.contains('a'))
+    self.assertFalse(self.q.contains('b'))
+
+class IndexedQueueTests(QueueTests):
+  def setUp(self):
+    self.q = Queue(LinkedList(index=True))
+
+  def test_index_tracks_counts(self):
+    ll = LinkedList(index=True)
+    ll.add_to_tail('x')
+    ll.add_to_head('x')
+    ll.extend(['y'])
+    self.assertEqual(ll.index, {'x': 2, 'y': 1})
+    self.assertEqual(ll.pop_head(), 'x')
+    self.assertEqual(ll.index, {'x': 1, 'y': 1})
+    self.assertEqual(list(ll.drain()), ['x', 'y'])
+    self.assertEqual(ll.index, {})
+
+  def test_unhashable_values_leave_list_unchanged(self):
+    ll = LinkedList(index=True)
+    self.assertRaises(TypeError, ll.add_to_tail, [])
+    self.assertRaises(TypeError, ll.add_to_head, [])
+    self.assertEqual(ll.length, 0)
+    self.assertIsNone(ll.head)
+    ll.add_to_tail('x')
+    self.assertRaises(TypeError, ll.extend, ['y', 'z', []])
+    self.assertEqual(ll.length, 1)
+    self.assertEqual(ll.index, {'x': 1})
+    self.assertEqual(list(ll.drain()), ['x'])
+
+  def test_failing_iterable_leaves_index_unchanged(self):
+    def values():
+      yield 'a'
+      yield 'b'
+      raise ValueError
+    ll = LinkedList(index=True)
+    self.assertRaises(ValueError, ll.extend, values())
+    self.assertEqual(ll.length, 0)
+    self.assertEqual(ll.index, {})
+    self.assertFalse(ll.contains('a'))
+
+  def test_splice_of_unhashable_values_leaves_both_lists_unchanged(self):
+    ll = LinkedList(index=True)
+    ll.add_to_tail('x')
+    plain = LinkedList()
+    plain.extend(['y', [], 'x'])
+    self.assertRaises(TypeError, ll.splice, plain)
+    self.assertEqual(ll.index, {'x': 1})
+    self.assertEqual(ll.length, 1)
+    self.assertEqual(plain.length, 3)
+    self.assertEqual(list(plain.drain()), ['y', [], 'x'])
+
+  def test_splice_merges_index(self):
+    indexed = Queue(LinkedList(index=True))
+    indexed.enqueue_many([1, 2])
+    plain = Queue()
+    plain.enqueue_many([2, 3])
+    self.q.enqueue_many(indexed)
+    self.q.enqueue_many(plain)
+    self.assertEqual(self.q.storage.index, {1: 1, 2: 2, 3: 1})
+    self.assertEqual(indexed.storage.index, {})
+    self.assertFalse(indexed.contains(1))
+
+  def test_memory_usage(self):
+    self.assertEqual(Queue().storage.memory_usage()['index'], 0)
+    self.q.enqueue_many(range(100))
+    usage = self.q.storage.memory_usage()
+    self.assertGreater(usage['nodes'], 0)
+    self.assertGreater(usage['index'], 0)
+
+class ArrayDequeQueueTests(QueueTests):
+  def setUp(self):
+    self.q = Queue(ArrayDeque())
+
+  def test_wraps_around_and_grows(self):
+    for i in range(6):
+      self.q.enqueue(i)
+    for i in range(4):
+      self.assertEqual(self.q.dequeue(), i)
+    for i in range(6, 20):
+      self.q.enqueue(i)
+    self.assertEqual(self.q.len(), 16)
+    self.assertEqual([self.q.dequeue() for _ in range(16)], list(range(4, 20)))
+
+  def test_shrinks_on_drain(self):
+    for i in range(1000):
+      self.q.enqueue(i)
+    grown = len(self.q.storage.storage)
+    for i in range(990):
+      self.assertEqual(self.q.dequeue(), i)
+    self.assertLess(len(self.q.storage.storage), grown)
+    self.assertEqual([self.q.dequeue() for _ in range(10)], list(range(990, 1000)))
+    self.assertEqual(len(self.q.storage.storage), ArrayDeque.MIN_CAPACITY)
+
+  def test_enqueue_many_from_linked_queue(self):
+    other = Queue()
+    other.enqueue_many(range(20))
+    self.q.enqueue_many(other)
+    self.assertEqual(other.len(), 0)
+    self.assertEqual(self.q.dequeue_many(25), list(range(20)))
+
+  def test_dequeue_many_wraps_around(self):
+    self.q.enqueue_many(range(6))
+    self.q.dequeue_many(5)
+    self.q.enqueue_many(range(6, 12))
+    self.assertEqual(self.q.dequeue_many(4), [5, 6, 7, 8])
+    self.assertEqual(self.q.dequeue_many(4), [9, 10, 11])
+
+  def test_add_to_head(self):
+    deque = ArrayDeque()
+    for i in range(10):
+      deque.add_to_head(i)
+    self.assertTrue(deque.contains(0))
+    self.assertFalse(deque.contains(10))
+    self.assertEqual([deque.pop_head() for _ in range(10)], list(range(9, -1, -1)))
+
 if __name__ == '__main__':
   unittest.main()
 
@@ -0,0 +1,171 @@
+"""Benchmarks for DoublyLinkedList.
+
+Run with `python3 bench_doubly_linked_list.py [n_elements]`.
+"""
+import random
+import sys
+import time
+import tracemalloc
+
+import doubly_linked_list
+from doubly_linked_list import DoublyLinkedList, NodePool
+from unrolled_linked_list import UnrolledLinkedList
+
+
+class DictListNode:
+    """ListNode as it was before __slots__, for comparison."""
+    def __init__(self, value, prev=None, next=None):
+        self.value = value
+        self.prev = prev
+        self.next = next
+
+
+def bytes_per_element(n, make_list=None):
+    values = list(range(n))  # allocated up front so only the list counts
+    tracemalloc.start()
+    dll = make_list() if make_list else DoublyLinkedList()
+    for value in values:
+        dll.add_to_tail(value)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / n
+
+
+class CountedListNode(doubly_linked_list.ListNode):
+    """ListNode that counts its constructions, so lists with and
+    without a pool are measured the same way."""
+    __slots__ = ()
+    created = 0
+
+    def __init__(self, value, prev=None, next=None):
+        CountedListNode.created += 1
+        super().__init__(value, prev, next)
+
+
+def refilled_bytes_per_element(n):
+    """bytes_per_element for a pooled list that was filled and emptied
+    once before measuring, so the measured adds reuse pooled nodes."""
+    values = list(range(n))
+    dll = DoublyLinkedList(pool=NodePool())
+    for value in values:
+        dll.add_to_tail(value)
+    for _ in range(n):
+        dll.remove_from_head()
+
+    tracemalloc.start()
+    for value in values:
+        dll.add_to_tail(value)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / n
+
+
+def churn(n, pool=None):
+    """Keep ~1000 elements alive while pushing n through the list.
+    Returns the seconds taken."""
+    dll = DoublyLinkedList(pool=pool)
+    for i in range(1000):
+        dll.add_to_tail(i)
+
+    start_time = time.perf_counter()
+    for i in range(n):
+        dll.add_to_tail(i)
+        dll.remove_from_head()
+    return time.perf_counter() - start_time
+
+
+def churn_allocations(n, pool=None):
+    """Node constructions during churn(n, pool), counted in a separate
+    run so the counting doesn't skew the timings."""
+    plain = doubly_linked_list.ListNode
+    doubly_linked_list.ListNode = CountedListNode
+    CountedListNode.created = 0
+    try:
+        churn(n, pool)
+    finally:
+        doubly_linked_list.ListNode = plain
+    return CountedListNode.created
+
+
+def bench_memory(n):
+    print(f"---- memory, {n:,} elements ----")
+    slotted = doubly_linked_list.ListNode
+    doubly_linked_list.ListNode = DictListNode
+    print(f"__dict__ nodes:       {bytes_per_element(n):6.1f} bytes/element")
+    doubly_linked_list.ListNode = slotted
+    print(f"__slots__ nodes:      {bytes_per_element(n):6.1f} bytes/element")
+    print(f"__slots__ + NodePool: {refilled_bytes_per_element(n):6.1f} bytes/element"
+          " (refilled after emptying)")
+
+    print(f"---- add/remove churn, {n:,} operations ----")
+    for label, make_pool in (('no pool', lambda: None), ('NodePool', NodePool)):
+        elapsed = churn(n, make_pool())
+        allocations = churn_allocations(n, make_pool())
+        print(f"{label:<9} {elapsed:7.3f}s {allocations:>10,} node allocations")
+
+
+def mutate_and_query(dll, n, rng):
+    """n rounds of one random mutation followed by get_max/get_min"""
+    for _ in range(n):
+        op = rng.random()
+        if op < 0.4:
+            dll.add_to_tail(rng.random())
+        elif op < 0.6:
+            dll.add_to_head(rng.random())
+        elif op < 0.8:
+            dll.remove_from_head()
+        elif dll.head and dll.head.next:
+            dll.move_to_front(dll.tail)
+            dll.delete(dll.head.next)
+        dll.get_max()
+        dll.get_min()
+
+
+def bench_get_max(n, size=1000):
+    print(f"---- {n:,} mutations + max/min queries, ~{size:,} elements ----")
+    for track_extrema in (False, True):
+        rng = random.Random(0)
+        dll = DoublyLinkedList(track_extrema=track_extrema)
+        for _ in range(size):
+            dll.add_to_tail(rng.random())
+
+        start_time = time.perf_counter()
+        mutate_and_query(dll, n, rng)
+        elapsed = time.perf_counter() - start_time
+        label = 'heaps' if track_extrema else 'scan'
+        print(f"{label:<6} {elapsed:7.3f}s {n / elapsed:12,.0f} rounds/s")
+
+
+def iterate_nodes(dll):
+    total = 0
+    current = dll.head
+    while current:
+        total += current.value
+        current = current.next
+    return total
+
+
+def bench_unrolled(n):
+    print(f"---- DoublyLinkedList vs UnrolledLinkedList, {n:,} elements ----")
+    print(f"{'list':<24} {'bytes/element':>13} {'iterate':>9}")
+    for label, make_list, iterate in (
+        ('DoublyLinkedList', DoublyLinkedList, iterate_nodes),
+        ('Unrolled, capacity 16', lambda: UnrolledLinkedList(16), sum),
+        ('Unrolled, capacity 64', lambda: UnrolledLinkedList(64), sum),
+        ('Unrolled, capacity 256', lambda: UnrolledLinkedList(256), sum),
+    ):
+        per_element = bytes_per_element(n, make_list=make_list)
+        ll = make_list()
+        for i in range(n):
+            ll.add_to_tail(i)
+        start_time = time.perf_counter()
+        iterate(ll)
+        elapsed = time.perf_counter() - start_time
+        print(f"{label:<24} {per_element:13.1f} {elapsed:8.3f}s")
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+    bench_memory(n)
+    bench_get_max(n // 100)
+    bench_unrolled(n)
@@ -1,6 +1,8 @@
+import random
 import unittest
 from doubly_linked_list import ListNode
 from doubly_linked_list import DoublyLinkedList
+from doubly_linked_list import NodePool
 
 class DoublyLinkedListTests(unittest.TestCase):
   def setUp(self):
@@ -140,6 +142,44 @@ class DoublyLinkedListTests(unittest.TestCase):
     self.assertEqual(self.dll.tail.value, 6)
     self.assertEqual(len(self.dll), 1)
 
+  def test_list_delete_middle(self):
+    self.dll.add_to_tail(2)
+    self.dll.add_to_tail(3)
+    middle = self.dll.head.next
+
+    self.dll.delete(middle)
+    self.assertEqual(self.dll.head.value, 1)
+    self.assertEqual(self.dll.head.next.value, 3)
+    self.assertEqual(self.dll.tail.prev.value, 1)
+    self.assertEqual(len(self.dll), 2)
+
+    self.dll.delete(self.dll.tail)
+    self.assertEqual(self.dll.tail.value, 1)
+    self.assertIsNone(self.dll.tail.next)
+    self.assertEqual(len(self.dll), 1)
+
+  def test_move_keeps_node_handles(self):
+    self.dll.add_to_tail(2)
+    self.dll.add_to_tail(3)
+    middle = self.dll.head.next
+
+    self.dll.move_to_front(middle)
+    self.assertIs(self.dll.head, middle)
+    self.assertEqual(self.dll.head.next.value, 1)
+    self.assertEqual(self.dll.tail.prev.value, 1)
+    self.assertIsNone(middle.prev)
+
+    self.dll.move_to_end(middle)
+    self.assertIs(self.dll.tail, middle)
+    self.assertEqual(self.dll.tail.prev.value, 3)
+    self.assertEqual(self.dll.head.value, 1)
+    self.assertIsNone(middle.next)
+    self.assertEqual(len(self.dll), 3)
+
+    self.dll.move_to_front(self.node)
+    self.assertIs(self.dll.head, self.node)
+    self.assertEqual(len(self.dll), 3)
+
   def test_get_max(self):
     self.assertEqual(self.dll.get_max(), 1)
     self.dll.add_to_tail(100)
@@ -149,5 +189,160 @@ class DoublyLinkedListTests(unittest.TestCase):
     self.dll.add_to_tail(101)
     self.assertEqual(self.dll.get_max(), 101)
 
+  def test_get_min(self):
+    self.assertEqual(self.dll.get_min(), 1)
+    self.dll.add_to_tail(-5)
+    self.dll.add_to_head(7)
+    self.assertEqual(self.dll.get_min(), -5)
+    self.dll.remove_from_tail()
+    self.assertEqual(self.dll.get_min(), 1)
+
+  def test_iteration(self):
+    self.dll.add_to_tail(2)
+    self.dll.add_to_tail(3)
+    self.assertEqual(list(self.dll), [1, 2, 3])
+    self.assertEqual(list(reversed(self.dll)), [3, 2, 1])
+    self.assertEqual(list(DoublyLinkedList()), [])
+
+  def test_indexing_and_slicing(self):
+    dll = DoublyLinkedList.from_iterable(range(10))
+    expected = list(range(10))
+    for i in range(-10, 10):
+      self.assertEqual(dll[i], expected[i])
+    self.assertRaises(IndexError, lambda: dll[10])
+    self.assertRaises(IndexError, lambda: dll[-11])
+    for s in (slice(None), slice(2, 7), slice(-3, None), slice(1, 9, 3),
+              slice(None, None, -1), slice(8, 2, -2), slice(5, 5),
+              slice(7, 2), slice(-20, 20, 4)):
+      sliced = dll[s]
+      self.assertIsInstance(sliced, DoublyLinkedList)
+      self.assertEqual(list(sliced), expected[s])
+      self.assertEqual(list(reversed(sliced)), expected[s][::-1])
+    self.assertEqual(list(dll), expected)
+
+  def test_extend(self):
+    self.dll.extend([2, 3, 4])
+    self.dll.extend([])
+    self.assertEqual(len(self.dll), 4)
+    self.assertEqual(list(self.dll), [1, 2, 3, 4])
+    self.assertEqual(list(reversed(self.dll)), [4, 3, 2, 1])
+    self.assertEqual(self.dll.get_max(), 4)
+    self.assertEqual(self.dll.remove_from_tail(), 4)
+
+  def test_from_iterable(self):
+    dll = DoublyLinkedList.from_iterable(x * 2 for x in range(5))
+    self.assertEqual(len(dll), 5)
+    self.assertEqual(list(dll), [0, 2, 4, 6, 8])
+    self.assertEqual(dll.head.value, 0)
+    self.assertEqual(dll.tail.value, 8)
+    self.assertIsNone(dll.head.prev)
+    self.assertIsNone(dll.tail.next)
+
+  def test_splice(self):
+    other = DoublyLinkedList.from_iterable([20, 30])
+    self.dll.splice(other)
+    self.assertEqual(list(self.dll), [1, 20, 30])
+    self.assertEqual(list(reversed(self.dll)), [30, 20, 1])
+    self.assertEqual(len(self.dll), 3)
+    self.assertEqual(self.dll.get_max(), 30)
+    self.assertEqual(len(other), 0)
+    self.assertIsNone(other.head)
+    self.assertIsNone(other.tail)
+
+    self.dll.splice(other)
+    self.assertEqual(len(self.dll), 3)
+    empty = DoublyLinkedList()
+    empty.splice(self.dll)
+    self.assertEqual(list(empty), [1, 20, 30])
+
+  def test_node_has_no_dict(self):
+    self.assertFalse(hasattr(self.node, '__dict__'))
+
+class PooledDoublyLinkedListTests(DoublyLinkedListTests):
+  def setUp(self):
+    self.pool = NodePool()
+    self.node = ListNode(1)
+    self.dll = DoublyLinkedList(self.node, self.pool)
+
+  def test_pool_recycles_removed_nodes(self):
+    self.dll.add_to_tail(2)
+    self.dll.add_to_tail(3)
+    self.assertEqual(self.pool.allocated, 2)
+
+    tail = self.dll.tail
+    self.assertEqual(self.dll.remove_from_tail(), 3)
+    self.assertEqual(self.dll.remove_from_head(), 1)
+    self.assertEqual(self.pool.free_count, 2)
+    self.assertIsNone(tail.value)
+
+    self.dll.add_to_head(4)
+    self.dll.add_to_tail(5)
+    self.dll.add_to_tail(6)
+    self.dll.move_to_front(self.dll.tail)
+    self.dll.move_to_end(self.dll.head)
+    self.assertEqual(self.pool.reused, 2)
+    self.assertEqual(self.pool.allocated, 3)
+    self.assertEqual(self.pool.free_count, 0)
+    self.assertEqual(self.dll.head.value, 4)
+    self.assertEqual(self.dll.head.next.value, 2)
+    self.assertEqual(self.dll.tail.value, 6)
+    self.assertIsNone(self.dll.head.prev)
+    self.assertIsNone(self.dll.tail.next)
+
+  def test_pool_is_shared_between_lists(self):
+    other = DoublyLinkedList(pool=self.pool)
+    self.dll.remove_from_head()
+    other.add_to_tail(7)
+    self.assertIs(other.head, self.node)
+    self.assertEqual(self.pool.allocated, 0)
+    self.assertEqual(self.pool.reused, 1)
+
+class TrackedDoublyLinkedListTests(DoublyLinkedListTests):
+  def setUp(self):
+    self.node = ListNode(1)
+    self.dll = DoublyLinkedList(self.node, track_extrema=True)
+
+  def test_extrema_follow_removals(self):
+    for value in (5, 9, 9, 2):
+      self.dll.add_to_tail(value)
+    self.assertEqual(self.dll.get_max(), 9)
+    self.assertEqual(self.dll.get_min(), 1)
+
+    self.dll.delete(self.dll.tail.prev)  # one of the 9s
+    self.assertEqual(self.dll.get_max(), 9)
+    self.dll.remove_from_head()
+    self.assertEqual(self.dll.get_min(), 2)
+    self.dll.move_to_front(self.dll.tail)
+    self.dll.delete(self.dll.tail)  # the other 9
+    self.assertEqual(self.dll.get_max(), 5)
+    self.dll.remove_from_tail()
+    self.dll.remove_from_tail()
+    self.assertIsNone(self.dll.get_max())
+    self.assertIsNone(self.dll.get_min())
+
+  def test_extrema_match_scan(self):
+    random.seed(7)
+    plain = DoublyLinkedList(ListNode(1))
+    for _ in range(2000):
+      op = random.random()
+      value = random.randint(0, 50)
+      if op < 0.3:
+        self.dll.add_to_tail(value)
+        plain.add_to_tail(value)
+      elif op < 0.55:
+        self.dll.add_to_head(value)
+        plain.add_to_head(value)
+      elif op < 0.75:
+        self.dll.remove_from_head()
+        plain.remove_from_head()
+      elif op < 0.9:
+        self.dll.remove_from_tail()
+        plain.remove_from_tail()
+      elif self.dll.head:
+        self.dll.delete(self.dll.head.next or self.dll.head)
+        plain.delete(plain.head.next or plain.head)
+      self.assertEqual(self.dll.get_max(), plain.get_max())
+      self.assertEqual(self.dll.get_min(), plain.get_min())
+
 if __name__ == '__main__':
   unittest.main()
\ No newline at end of file
@@ -0,0 +1,75 @@
+import unittest
+from unrolled_linked_list import UnrolledLinkedList
+
+class UnrolledLinkedListTests(unittest.TestCase):
+  def setUp(self):
+    self.ull = UnrolledLinkedList(capacity=4)
+
+  def test_empty_list(self):
+    self.assertEqual(len(self.ull), 0)
+    self.assertIsNone(self.ull.remove_from_head())
+    self.assertIsNone(self.ull.remove_from_tail())
+    self.assertEqual(list(self.ull), [])
+    self.assertRaises(IndexError, lambda: self.ull[0])
+
+  def test_add_and_remove_from_both_ends(self):
+    for i in range(10):
+      self.ull.add_to_tail(i)
+    for i in range(1, 6):
+      self.ull.add_to_head(-i)
+    self.assertEqual(len(self.ull), 15)
+    self.assertEqual(list(self.ull), list(range(-5, 10)))
+
+    self.assertEqual(self.ull.remove_from_head(), -5)
+    self.assertEqual(self.ull.remove_from_tail(), 9)
+    self.assertEqual(len(self.ull), 13)
+    self.assertEqual(list(self.ull), list(range(-4, 9)))
+
+  def test_drains_across_chunks(self):
+    for i in range(9):
+      self.ull.add_to_tail(i)
+    self.assertEqual([self.ull.remove_from_head() for _ in range(9)],
+                     list(range(9)))
+    self.assertIsNone(self.ull.head)
+    self.assertIsNone(self.ull.tail)
+
+    for i in range(9):
+      self.ull.add_to_head(i)
+    self.assertEqual([self.ull.remove_from_head() for _ in range(9)],
+                     list(range(8, -1, -1)))
+    self.assertEqual(len(self.ull), 0)
+
+    self.ull.add_to_head(1)
+    self.ull.add_to_head(0)
+    self.assertEqual(self.ull.remove_from_tail(), 1)
+    self.assertEqual(self.ull.remove_from_tail(), 0)
+    self.assertIsNone(self.ull.head)
+
+  def test_indexing(self):
+    expected = []
+    for i in range(11):
+      self.ull.add_to_tail(i)
+      expected.append(i)
+    for i in range(1, 4):
+      self.ull.add_to_head(-i)
+      expected.insert(0, -i)
+    self.ull.remove_from_head()
+    expected.pop(0)
+
+    for i in range(len(expected)):
+      self.assertEqual(self.ull[i], expected[i])
+      self.assertEqual(self.ull[-i - 1], expected[-i - 1])
+    self.assertRaises(IndexError, lambda: self.ull[len(expected)])
+    self.assertRaises(IndexError, lambda: self.ull[-len(expected) - 1])
+
+  def test_capacity_must_be_positive(self):
+    self.assertRaises(ValueError, UnrolledLinkedList, 0)
+    self.assertRaises(ValueError, UnrolledLinkedList, -1)
+    ull = UnrolledLinkedList(1)
+    ull.add_to_head(1)
+    ull.add_to_head(0)
+    ull.add_to_tail(2)
+    self.assertEqual(list(ull), [0, 1, 2])
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,124 @@
+class UnrolledNode:
+    """Each UnrolledNode holds up to `capacity` values in a fixed-size
+    list, using the slots values[start:end], plus references to its
+    previous and next nodes."""
+    __slots__ = ('values', 'start', 'end', 'prev', 'next')
+
+    def __init__(self, capacity, start, prev=None, next=None):
+        self.values = [None] * capacity
+        self.start = start
+        self.end = start
+        self.prev = prev
+        self.next = next
+
+
+class UnrolledLinkedList:
+    """Doubly-linked list of fixed-capacity chunks. It keeps the
+    DoublyLinkedList add/remove contract but pays one node per chunk
+    instead of one per value, and indexing walks chunks, which is
+    O(n / capacity)."""
+    def __init__(self, capacity=64):
+        if capacity < 1:
+            raise ValueError('a chunk must hold at least one value')
+        self.capacity = capacity
+        self.head = None
+        self.tail = None
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        current = self.head
+        while current is not None:
+            values = current.values
+            for i in range(current.start, current.end):
+                yield values[i]
+            current = current.next
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError('UnrolledLinkedList index out of range')
+
+        # walk whole chunks from whichever end is closer
+        if index < self.length // 2:
+            current = self.head
+            while index >= current.end - current.start:
+                index -= current.end - current.start
+                current = current.next
+            return current.values[current.start + index]
+        else:
+            index = self.length - 1 - index
+            current = self.tail
+            while index >= current.end - current.start:
+                index -= current.end - current.start
+                current = current.prev
+            return current.values[current.end - 1 - index]
+
+    def add_to_head(self, value):
+        node = self.head
+        if node is None or node.start == 0:
+            # new head chunks fill from the back
+            node = UnrolledNode(self.capacity, self.capacity, next=self.head)
+            if self.head is not None:
+                self.head.prev = node
+            else:
+                self.tail = node
+            self.head = node
+
+        node.start -= 1
+        node.values[node.start] = value
+        self.length += 1
+
+    def add_to_tail(self, value):
+        node = self.tail
+        if node is None or node.end == self.capacity:
+            # new tail chunks fill from the front
+            node = UnrolledNode(self.capacity, 0, prev=self.tail)
+            if self.tail is not None:
+                self.tail.next = node
+            else:
+                self.head = node
+            self.tail = node
+
+        node.values[node.end] = value
+        node.end += 1
+        self.length += 1
+
+    def remove_from_head(self):
+        node = self.head
+        if node is None:
+            return None
+
+        value = node.values[node.start]
+        node.values[node.start] = None
+        node.start += 1
+        self.length -= 1
+
+        if node.start == node.end:  # chunk is empty, drop it
+            self.head = node.next
+            if self.head is not None:
+                self.head.prev = None
+            else:
+                self.tail = None
+        return value
+
+    def remove_from_tail(self):
+        node = self.tail
+        if node is None:
+            return None
+
+        node.end -= 1
+        value = node.values[node.end]
+        node.values[node.end] = None
+        self.length -= 1
+
+        if node.start == node.end:  # chunk is empty, drop it
+            self.tail = node.prev
+            if self.tail is not None:
+                self.tail.next = None
+            else:
+                self.head = None
+        return value
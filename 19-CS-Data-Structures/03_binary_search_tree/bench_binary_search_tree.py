@@ -0,0 +1,119 @@
+"""Build and lookup timings for BinarySearchTreeNode.
+
+Run with `python3 bench_binary_search_tree.py [n_keys ...]`, e.g.
+`python3 bench_binary_search_tree.py 100000 1000000`.
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from binary_search_tree import BinarySearchTreeNode
+from red_black_tree import RedBlackTree
+from frozen_tree import FrozenTree
+
+
+# one-at-a-time inserts of sorted keys build a linked list, O(n^2)
+MAX_DEGENERATE = 20000
+
+
+def key_orders(n):
+    keys = list(range(n))
+    shuffled = keys[:]
+    random.Random(0).shuffle(shuffled)
+    return {
+        'sorted': keys,
+        'reverse-sorted': keys[::-1],
+        'random': shuffled,
+    }
+
+
+def insert_all(keys, engine=BinarySearchTreeNode):
+    root = engine(keys[0])
+    for key in keys[1:]:
+        root.insert(key)
+    return root
+
+
+def lookup_all(root, keys):
+    for key in keys:
+        root.contains(key)
+
+
+def report(label, n, build, keys):
+    start_time = time.perf_counter()
+    root = build(keys)
+    built = time.perf_counter() - start_time
+
+    probes = keys[:10000]
+    start_time = time.perf_counter()
+    lookup_all(root, probes)
+    looked_up = time.perf_counter() - start_time
+
+    print(
+        f"{label:<36} {n:>9,} keys  build {built:7.3f}s  "
+        f"lookup {len(probes) / looked_up:11,.0f}/s  height {root.height()}"
+    )
+
+
+def compare_engines(n):
+    """Plain BST against the red-black engine, one insert at a time."""
+    for order, keys in key_orders(n).items():
+        for engine in (BinarySearchTreeNode, RedBlackTree):
+            label = f"{engine.__name__}, {order}"
+            if engine is BinarySearchTreeNode and order != 'random' \
+                    and n > MAX_DEGENERATE:
+                print(f"{label:<36} {n:>9,} keys  skipped, O(n^2)")
+                continue
+            report(label, n, lambda keys: insert_all(keys, engine), keys)
+
+
+def compare_frozen(n):
+    """Memory per key and lookup latency, pointer tree vs FrozenTree."""
+    keys = list(range(n))
+    probes = random.Random(1).sample(keys, min(n, 100000))
+
+    def measure(label, build):
+        tracemalloc.start()
+        tree = build()
+        per_key = tracemalloc.get_traced_memory()[0] / n
+        tracemalloc.stop()
+
+        start_time = time.perf_counter()
+        lookup_all(tree, probes)
+        latency = (time.perf_counter() - start_time) / len(probes)
+        print(f"{label:<36} {n:>9,} keys  {per_key:6.1f} bytes/key  "
+              f"lookup {latency * 1e9:6.0f} ns")
+        return tree
+
+    measure('BinarySearchTreeNode.from_sorted',
+            lambda: BinarySearchTreeNode.from_sorted(keys))
+    frozen = measure('FrozenTree', lambda: FrozenTree.from_sorted(keys))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'tree.bin')
+        frozen.save(path)
+        loaded = measure('FrozenTree, memory-mapped',
+                         lambda: FrozenTree.load(path))
+        loaded.close()
+
+
+def run(n):
+    for order, keys in key_orders(n).items():
+        if order == 'random' or n <= MAX_DEGENERATE:
+            report(f"insert, {order}", n, insert_all, keys)
+        else:
+            print(f"{'insert, ' + order:<36} {n:>9,} keys  skipped, O(n^2)")
+        report(f"from_sorted, {order}", n,
+               lambda keys: BinarySearchTreeNode.from_sorted(sorted(keys)),
+               keys)
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10 ** 5]
+    for n in sizes:
+        run(n)
+        compare_engines(n)
+        compare_frozen(n)
@@ -1,42 +1,220 @@
 class BinarySearchTreeNode:
+    __slots__ = ('value', 'left', 'right', 'size')  # no per-node __dict__
+
     def __init__(self, value):
         self.value = value
         self.left = None
         self.right = None
+        self.size = 1  # number of values in this subtree
+
+    @classmethod
+    def from_sorted(cls, values):
+        """Build a perfectly balanced tree from already sorted values
+        in O(n). Returns the root node, or None if values is empty."""
+        values = list(values)
+        if not values:
+            return None
+
+        mid = (len(values) - 1) // 2
+        root = cls(values[mid])
+        root.size = len(values)
+        # each entry: (parent, attribute to fill, lo, hi) for values[lo:hi]
+        stack = [(root, 'left', 0, mid), (root, 'right', mid + 1, len(values))]
+        while stack:
+            parent, side, lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi - 1) // 2
+            node = cls(values[mid])
+            node.size = hi - lo
+            setattr(parent, side, node)
+            stack.append((node, 'left', lo, mid))
+            stack.append((node, 'right', mid + 1, hi))
+
+        return root
+
+    def __iter__(self):
+        return in_order(self)
 
     def insert(self, value):
-        if value < self.value:
-            if not self.left:
-                self.left = BinarySearchTreeNode(value)  
+        current = self
+        while True:
+            current.size += 1
+            if value < current.value:
+                if current.left is None:
+                    current.left = BinarySearchTreeNode(value)
+                    return
+                current = current.left
             else:
-                self.left.insert(value)
-        else:
-            if not self.right:
-                self.right = BinarySearchTreeNode(value)
-            else:
-                self.right.insert(value)
+                if current.right is None:
+                    current.right = BinarySearchTreeNode(value)
+                    return
+                current = current.right
 
     def contains(self, target):
-        if self.value == target:
-            return True
-        elif (target < self.value) and self.left:
-            return self.left.contains(target)
-        elif (self.value < target) and self.right:
-            return self.right.contains(target)
-        else:
-            return False
+        current = self
+        while current is not None:
+            if current.value == target:
+                return True
+            elif target < current.value:
+                current = current.left
+            else:
+                current = current.right
+        return False
 
     def get_max(self):
-        if not self.value:
+        if self.value is None:
             return None
-        elif self.right:
-            return self.right.get_max()
-        else:
-            return self.value
+
+        current = self
+        while current.right is not None:
+            current = current.right
+        return current.value
 
     def for_each(self, cb):
-        cb(self.value)
-        if self.left:
-            self.left.for_each(cb)
-        if self.right:
-            self.right.for_each(cb)
+        # pre-order, same as the recursive version: node, left, right
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            cb(node.value)
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+
+    def height(self):
+        """Number of edges on the longest root-to-leaf path."""
+        height = -1
+        level = [self]
+        while level:
+            height += 1
+            level = [child for node in level
+                     for child in (node.left, node.right) if child is not None]
+        return height
+
+    # ordered-map operations, see the module-level helpers below
+    def in_order(self):
+        return in_order(self)
+
+    def reverse_order(self):
+        return reverse_order(self)
+
+    def range(self, lo, hi):
+        return value_range(self, lo, hi)
+
+    def rank(self, key):
+        return rank(self, key)
+
+    def select(self, k):
+        return select(self, k)
+
+    def floor(self, key):
+        return floor(self, key)
+
+    def ceiling(self, key):
+        return ceiling(self, key)
+
+
+# Helpers shared by any tree whose nodes have value/left/right/size,
+# e.g. BinarySearchTreeNode and RedBlackNode. Traversals use an explicit
+# stack and yield lazily; rank and select are O(height).
+
+def _size(node):
+    return node.size if node is not None else 0
+
+
+def in_order(node):
+    """Yield values in ascending order."""
+    stack = []
+    while stack or node is not None:
+        if node is not None:
+            stack.append(node)
+            node = node.left
+        else:
+            node = stack.pop()
+            yield node.value
+            node = node.right
+
+
+def reverse_order(node):
+    """Yield values in descending order."""
+    stack = []
+    while stack or node is not None:
+        if node is not None:
+            stack.append(node)
+            node = node.right
+        else:
+            node = stack.pop()
+            yield node.value
+            node = node.left
+
+
+def value_range(node, lo, hi):
+    """Yield values v with lo <= v < hi in ascending order, without
+    visiting subtrees that lie entirely outside the range."""
+    stack = []
+    while stack or node is not None:
+        if node is not None:
+            if node.value < lo:
+                node = node.right  # the whole left subtree is < lo too
+            else:
+                stack.append(node)
+                node = node.left
+        else:
+            node = stack.pop()
+            if not node.value < hi:
+                return
+            yield node.value
+            node = node.right
+
+
+def rank(node, key):
+    """Number of values strictly less than key."""
+    count = 0
+    while node is not None:
+        if node.value < key:
+            count += _size(node.left) + 1
+            node = node.right
+        else:
+            node = node.left
+    return count
+
+
+def select(node, k):
+    """The k-th smallest value, counting from 0."""
+    if not 0 <= k < _size(node):
+        raise IndexError('select index out of range')
+
+    while True:
+        left_size = _size(node.left)
+        if k < left_size:
+            node = node.left
+        elif k == left_size:
+            return node.value
+        else:
+            k -= left_size + 1
+            node = node.right
+
+
+def floor(node, key):
+    """Largest value <= key, or None."""
+    best = None
+    while node is not None:
+        if key < node.value:
+            node = node.left
+        else:
+            best = node.value
+            node = node.right
+    return best
+
+
+def ceiling(node, key):
+    """Smallest value >= key, or None."""
+    best = None
+    while node is not None:
+        if node.value < key:
+            node = node.right
+        else:
+            best = node.value
+            node = node.left
+    return best
@@ -54,6 +54,89 @@ class BinarySearchTreeTests(unittest.TestCase):
     self.assertTrue(v4 in arr)
     self.assertTrue(v5 in arr)
 
+  def test_for_each_is_pre_order(self):
+    for value in (3, 8, 1, 4, 9):
+      self.bst.insert(value)
+    arr = []
+    self.bst.for_each(arr.append)
+    self.assertEqual(arr, [5, 3, 1, 4, 8, 9])
+
+  def test_sorted_insert_does_not_recurse(self):
+    for value in range(6, 5000):
+      self.bst.insert(value)
+    self.assertTrue(self.bst.contains(4999))
+    self.assertFalse(self.bst.contains(5000))
+    self.assertEqual(self.bst.get_max(), 4999)
+    self.assertEqual(self.bst.height(), 4994)
+    arr = []
+    self.bst.for_each(arr.append)
+    self.assertEqual(len(arr), 4995)
+
+  def test_from_sorted(self):
+    self.assertIsNone(BinarySearchTreeNode.from_sorted([]))
+
+    bst = BinarySearchTreeNode.from_sorted(range(1000))
+    self.assertEqual(bst.height(), 9)
+    self.assertEqual(bst.get_max(), 999)
+    for value in range(1000):
+      self.assertTrue(bst.contains(value))
+    self.assertFalse(bst.contains(-1))
+    self.assertFalse(bst.contains(1000))
+
+    bst = BinarySearchTreeNode.from_sorted([1, 2, 3])
+    self.assertEqual(bst.value, 2)
+    self.assertEqual(bst.left.value, 1)
+    self.assertEqual(bst.right.value, 3)
+
+  def test_in_order_iterators(self):
+    values = [8, 3, 9, 1, 4, 7, 5]
+    for value in values:
+      self.bst.insert(value)
+    self.assertEqual(list(self.bst.in_order()), sorted(values + [5]))
+    self.assertEqual(list(self.bst), sorted(values + [5]))
+    self.assertEqual(list(self.bst.reverse_order()),
+                     sorted(values + [5], reverse=True))
+    self.assertEqual(self.bst.size, 8)
+
+  def test_range(self):
+    bst = BinarySearchTreeNode.from_sorted(range(0, 100, 2))
+    self.assertEqual(list(bst.range(10, 20)), [10, 12, 14, 16, 18])
+    self.assertEqual(list(bst.range(11, 15)), [12, 14])
+    self.assertEqual(list(bst.range(-10, 3)), [0, 2])
+    self.assertEqual(list(bst.range(97, 200)), [98])
+    self.assertEqual(list(bst.range(50, 50)), [])
+
+    lazy = bst.range(0, 100)
+    self.assertEqual(next(lazy), 0)
+    self.assertEqual(next(lazy), 2)
+
+  def test_rank_and_select(self):
+    for value in (3, 8, 1, 4, 9, 5):
+      self.bst.insert(value)
+    ordered = [1, 3, 4, 5, 5, 8, 9]
+    for k, value in enumerate(ordered):
+      self.assertEqual(self.bst.select(k), value)
+    self.assertRaises(IndexError, self.bst.select, 7)
+    self.assertRaises(IndexError, self.bst.select, -1)
+
+    self.assertEqual(self.bst.rank(0), 0)
+    self.assertEqual(self.bst.rank(5), 3)
+    self.assertEqual(self.bst.rank(6), 5)
+    self.assertEqual(self.bst.rank(100), 7)
+
+    bst = BinarySearchTreeNode.from_sorted(range(1000))
+    self.assertEqual(bst.select(617), 617)
+    self.assertEqual(bst.rank(617), 617)
+
+  def test_floor_and_ceiling(self):
+    bst = BinarySearchTreeNode.from_sorted([10, 20, 30])
+    self.assertEqual(bst.floor(25), 20)
+    self.assertEqual(bst.floor(20), 20)
+    self.assertIsNone(bst.floor(5))
+    self.assertEqual(bst.ceiling(25), 30)
+    self.assertEqual(bst.ceiling(30), 30)
+    self.assertIsNone(bst.ceiling(31))
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,98 @@
+import os
+import random
+import struct
+import tempfile
+import unittest
+from binary_search_tree import BinarySearchTreeNode
+from frozen_tree import FrozenTree
+
+class FrozenTreeTests(unittest.TestCase):
+  def setUp(self):
+    self.values = list(range(0, 200, 3))
+    self.tree = FrozenTree.from_sorted(self.values)
+
+  def test_contains(self):
+    for value in self.values:
+      self.assertTrue(self.tree.contains(value))
+    for value in (-1, 1, 200, 1000):
+      self.assertFalse(self.tree.contains(value))
+
+  def test_eytzinger_layout(self):
+    tree = FrozenTree.from_sorted([1, 2, 3, 4, 5, 6, 7])
+    self.assertEqual(list(tree.keys), [4, 2, 6, 1, 3, 5, 7])
+    self.assertEqual(tree.keys.typecode, 'q')
+
+  def test_get_max_and_in_order(self):
+    self.assertEqual(self.tree.get_max(), 198)
+    self.assertEqual(list(self.tree), self.values)
+    self.assertEqual(len(self.tree), len(self.values))
+    empty = FrozenTree.from_sorted([])
+    self.assertIsNone(empty.get_max())
+    self.assertFalse(empty.contains(1))
+    for n in range(1, 20):
+      self.assertEqual(FrozenTree.from_sorted(range(n)).get_max(), n - 1)
+
+  def test_from_tree(self):
+    bst = BinarySearchTreeNode(50)
+    values = random.Random(1).sample(range(100), 30)
+    for value in values:
+      bst.insert(value)
+    frozen = FrozenTree.from_tree(bst)
+    self.assertEqual(list(frozen), sorted(values + [50]))
+
+  def test_string_keys_use_a_list(self):
+    tree = FrozenTree.from_sorted(['ann', 'bob', 'cy'])
+    self.assertIsInstance(tree.keys, list)
+    self.assertTrue(tree.contains('bob'))
+    self.assertFalse(tree.contains('al'))
+    self.assertRaises(TypeError, tree.save, 'unused')
+
+  def test_nodes_have_no_dict(self):
+    self.assertFalse(hasattr(BinarySearchTreeNode(1), '__dict__'))
+
+  def test_save_and_mmap_load(self):
+    for values in (self.values, [0.5, 1.5, 2.25]):
+      tree = FrozenTree.from_sorted(values)
+      with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'tree.bin')
+        tree.save(path)
+        loaded = FrozenTree.load(path)
+        self.assertEqual(list(loaded), values)
+        self.assertTrue(loaded.contains(values[1]))
+        self.assertEqual(loaded.nbytes(), tree.nbytes())
+
+        copy_path = os.path.join(tmp, 'copy.bin')
+        loaded.save(copy_path)
+        loaded.close()
+        copy = FrozenTree.load(copy_path)
+        self.assertEqual(list(copy), values)
+        copy.close()
+
+  def test_load_rejects_other_files(self):
+    with tempfile.TemporaryDirectory() as tmp:
+      path = os.path.join(tmp, 'junk.bin')
+      with open(path, 'wb') as f:
+        f.write(b'x' * 64)
+      self.assertRaises(ValueError, FrozenTree.load, path)
+
+  def test_load_rejects_short_files(self):
+    with tempfile.TemporaryDirectory() as tmp:
+      path = os.path.join(tmp, 'tree.bin')
+      FrozenTree.from_sorted([1, 2, 3]).save(path)
+      with open(path, 'rb') as f:
+        data = f.read()
+      for length in (0, 10, len(data) - 1):
+        with open(path, 'wb') as f:
+          f.write(data[:length])
+        self.assertRaises(ValueError, FrozenTree.load, path)
+
+  def test_saved_keys_are_little_endian(self):
+    with tempfile.TemporaryDirectory() as tmp:
+      path = os.path.join(tmp, 'tree.bin')
+      FrozenTree.from_sorted([1, 2, 3]).save(path)
+      with open(path, 'rb') as f:
+        data = f.read()
+    self.assertEqual(data[FrozenTree.HEADER.size:], struct.pack('<3q', 2, 1, 3))
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+import random
+from red_black_tree import RedBlackTree
+
+class RedBlackTreeTests(unittest.TestCase):
+  def setUp(self):
+    self.tree = RedBlackTree(5)
+
+  def assertValidRedBlack(self, tree):
+    def black_height(node, parent):
+      if node is None:
+        return 0
+      self.assertIs(node.parent, parent)
+      if node.left:
+        self.assertLessEqual(node.left.value, node.value)
+      if node.right:
+        self.assertGreaterEqual(node.right.value, node.value)
+      if node.red:
+        self.assertFalse(node.left and node.left.red)
+        self.assertFalse(node.right and node.right.red)
+      left = black_height(node.left, node)
+      self.assertEqual(left, black_height(node.right, node))
+      return left + (0 if node.red else 1)
+
+    if tree.root:
+      self.assertFalse(tree.root.red)
+    black_height(tree.root, None)
+
+  def test_empty_tree(self):
+    tree = RedBlackTree()
+    self.assertEqual(len(tree), 0)
+    self.assertIsNone(tree.get_max())
+    self.assertFalse(tree.contains(1))
+    self.assertEqual(tree.height(), -1)
+    arr = []
+    tree.for_each(arr.append)
+    self.assertEqual(arr, [])
+
+  def test_contains(self):
+    self.tree.insert(2)
+    self.tree.insert(3)
+    self.tree.insert(7)
+    self.assertTrue(self.tree.contains(7))
+    self.assertTrue(self.tree.contains(5))
+    self.assertFalse(self.tree.contains(8))
+
+  def test_get_max(self):
+    self.assertEqual(self.tree.get_max(), 5)
+    self.tree.insert(30)
+    self.assertEqual(self.tree.get_max(), 30)
+    self.tree.insert(300)
+    self.tree.insert(3)
+    self.assertEqual(self.tree.get_max(), 300)
+
+  def test_for_each(self):
+    values = [random.randint(1, 101) for _ in range(20)]
+    for value in values:
+      self.tree.insert(value)
+    arr = []
+    self.tree.for_each(arr.append)
+    self.assertEqual(sorted(arr), sorted(values + [5]))
+
+  def test_sorted_insert_stays_balanced(self):
+    tree = RedBlackTree()
+    for value in range(1023):
+      tree.insert(value)
+    self.assertValidRedBlack(tree)
+    self.assertEqual(len(tree), 1023)
+    self.assertLessEqual(tree.height(), 18)
+    self.assertEqual(tree.get_max(), 1022)
+
+  def test_random_insert_with_duplicates(self):
+    rng = random.Random(3)
+    values = [rng.randint(0, 200) for _ in range(2000)]
+    for value in values:
+      self.tree.insert(value)
+    self.assertValidRedBlack(self.tree)
+    for value in values:
+      self.assertTrue(self.tree.contains(value))
+    self.assertEqual(len(self.tree), 2001)
+
+  def test_ordered_operations(self):
+    rng = random.Random(5)
+    values = [rng.randint(0, 500) for _ in range(300)]
+    tree = RedBlackTree()
+    for value in values:
+      tree.insert(value)
+    ordered = sorted(values)
+
+    self.assertEqual(list(tree), ordered)
+    self.assertEqual(list(tree.reverse_order()), ordered[::-1])
+    self.assertEqual(list(tree.range(100, 200)),
+                     [v for v in ordered if 100 <= v < 200])
+    for k in range(0, 300, 7):
+      self.assertEqual(tree.select(k), ordered[k])
+    for key in range(-1, 502, 13):
+      self.assertEqual(tree.rank(key), sum(1 for v in values if v < key))
+      below = [v for v in ordered if v <= key]
+      above = [v for v in ordered if v >= key]
+      self.assertEqual(tree.floor(key), below[-1] if below else None)
+      self.assertEqual(tree.ceiling(key), above[0] if above else None)
+    self.assertEqual(tree.root.size, 300)
+
+
+if __name__ == '__main__':
+  unittest.main()
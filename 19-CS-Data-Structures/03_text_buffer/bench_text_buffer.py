@@ -0,0 +1,243 @@
+"""TextBuffer engines on multi-megabyte documents, against the original
+one-character-per-node buffer, a keystroke replay of an editing
+session, and the cost of TextBuffer's undo history.
+
+Run with `python3 bench_text_buffer.py [n_chars ...]`, e.g.
+`python3 bench_text_buffer.py 200000 4000000`; CharTextBuffer only runs
+for sizes up to MAX_CHAR_NODES.
+"""
+import random
+import sys
+import time
+import tracemalloc
+
+from doubly_linked_list import DoublyLinkedList
+from text_buffer import TextBuffer
+from rope_text_buffer import RopeTextBuffer
+from gap_text_buffer import GapTextBuffer
+
+
+LINE = "the quick brown fox jumps over the lazy dog\n"
+MAX_CHAR_NODES = 5 * 10 ** 5  # CharTextBuffer's str() is O(n^2) past this
+
+
+class CharTextBuffer:
+    """TextBuffer as it was before chunking, one character per node,
+    for comparison."""
+    def __init__(self, init=None):
+        self.contents = DoublyLinkedList()
+
+        if init:
+            self.append(init)
+
+    def __str__(self):
+        s = ""
+        current = self.contents.head
+        while current:
+            s += current.value
+            current = current.next
+        return s
+
+    def append(self, string_to_add):
+        for char in string_to_add:
+            self.contents.add_to_tail(char)
+
+    def prepend(self, string_to_add):
+        for char in string_to_add[::-1]:
+            self.contents.add_to_head(char)
+
+    def delete_front(self, chars_to_remove):
+        for _ in range(chars_to_remove):
+            self.contents.remove_from_head()
+
+    def delete_back(self, chars_to_remove):
+        for _ in range(chars_to_remove):
+            self.contents.remove_from_tail()
+
+    def join(self, other_buffer):
+        self.contents.tail.next = other_buffer.contents.head
+        other_buffer.contents.head.prev = self.contents.tail
+        self.contents.tail = other_buffer.contents.tail
+        self.contents.length += other_buffer.contents.length
+
+
+def document(n):
+    return (LINE * (n // len(LINE) + 1))[:n]
+
+
+def timed(action):
+    start_time = time.perf_counter()
+    result = action()
+    return result, time.perf_counter() - start_time
+
+
+def build(engine, text):
+    """Append text one line at a time, as a log or editor would."""
+    buffer = engine()
+    for start in range(0, len(text), len(LINE)):
+        buffer.append(text[start:start + len(LINE)])
+    return buffer
+
+
+def compare(n):
+    text = document(n)
+    for engine in (CharTextBuffer, TextBuffer, RopeTextBuffer):
+        if engine is CharTextBuffer and n > MAX_CHAR_NODES:
+            print(f"{engine.__name__:<16} {n:>11,} chars  skipped, O(n^2) str")
+            continue
+        tracemalloc.start()
+        buffer, built = timed(lambda: build(engine, text))
+        per_char = tracemalloc.get_traced_memory()[0] / n
+        tracemalloc.stop()
+
+        rendered, rendering = timed(lambda: str(buffer))
+        assert rendered == text
+
+        _, edited = timed(lambda: (buffer.prepend(LINE), buffer.append(LINE),
+                                   buffer.delete_front(len(LINE)),
+                                   buffer.delete_back(len(LINE))))
+        other = build(engine, LINE * 100)
+        _, joined = timed(lambda: buffer.join(other))
+
+        print(f"{engine.__name__:<16} {n:>11,} chars  "
+              f"build {built:6.2f}s  {per_char:6.1f} bytes/char  "
+              f"str {rendering * 1e3:8.1f} ms  "
+              f"edit ends {edited * 1e6:9.0f} us  join {joined * 1e6:7.0f} us")
+
+
+def middle_edits(n, edits=10000):
+    """Random inserts and deletes in the middle, which only the rope
+    supports without rebuilding the text."""
+    buffer = RopeTextBuffer(document(n))
+    rng = random.Random(0)
+    start_time = time.perf_counter()
+    for _ in range(edits):
+        pos = rng.randrange(len(buffer))
+        if rng.random() < 0.5:
+            buffer.insert(pos, "word ")
+        else:
+            buffer.delete(pos, 5)
+    elapsed = time.perf_counter() - start_time
+    print(f"{'RopeTextBuffer':<16} {n:>11,} chars  "
+          f"insert/delete at random positions {edits / elapsed:9,.0f}/s  "
+          f"height {buffer.root.height}")
+
+
+def session(n_chars, keystrokes, seed=0):
+    """An editing session as (action, argument) pairs: mostly typing
+    with some backspaces, short cursor moves and rare jumps."""
+    rng = random.Random(seed)
+    size, cursor = n_chars, n_chars // 2
+    events = []
+    for _ in range(keystrokes):
+        roll = rng.random()
+        if roll < 0.80:
+            events.append(('type', rng.choice('abcdefghij ')))
+            size += 1
+            cursor += 1
+        elif roll < 0.93:
+            if cursor:
+                events.append(('backspace', None))
+                size -= 1
+                cursor -= 1
+        elif roll < 0.999:
+            cursor = min(size, max(0, cursor + rng.randint(-80, 80)))
+            events.append(('move', cursor))
+        else:
+            cursor = rng.randint(0, size)
+            events.append(('move', cursor))
+    return events
+
+
+def replay_gap(buffer, events):
+    for action, arg in events:
+        if action == 'type':
+            buffer.write(arg)
+        elif action == 'backspace':
+            buffer.backspace()
+        else:
+            buffer.move_cursor(arg)
+
+
+def replay_positional(buffer, events, cursor):
+    # engines without a cursor track it here and edit by position
+    for action, arg in events:
+        if action == 'type':
+            buffer.insert(cursor, arg)
+            cursor += 1
+        elif action == 'backspace':
+            cursor -= 1
+            buffer.delete(cursor, 1)
+        else:
+            cursor = arg
+
+
+def keystroke_replay(n, keystrokes=200000):
+    text = document(n)
+    events = session(n, keystrokes)
+    results = []
+    for engine in (GapTextBuffer, RopeTextBuffer):
+        buffer = engine(text)
+        if engine is GapTextBuffer:
+            buffer.move_cursor(n // 2)
+            _, elapsed = timed(lambda: replay_gap(buffer, events))
+        else:
+            _, elapsed = timed(
+                lambda: replay_positional(buffer, events, n // 2))
+        results.append(str(buffer))
+        print(f"{engine.__name__:<16} {n:>11,} chars  "
+              f"keystroke replay {len(events) / elapsed:11,.0f} keys/s")
+    assert results[0] == results[1]
+
+
+def undo_history(edits=10 ** 5, caps=(None, 64 * 1024, 10 ** 6, 10 ** 9)):
+    """Memory held by the undo log and latency per undo for a session
+    of typing, backspaces and occasional pasted or cut lines."""
+    rng = random.Random(0)
+    session = []
+    for _ in range(edits):
+        roll = rng.random()
+        if roll < 0.7:
+            session.append(('append', rng.choice('abcdefghij ')))
+        elif roll < 0.9:
+            session.append(('delete_back', 1))
+        elif roll < 0.95:
+            session.append(('append', LINE * rng.randint(1, 20)))
+        elif roll < 0.98:
+            session.append(('delete_back', rng.randint(1, 500)))
+        else:
+            session.append(('prepend', LINE))
+
+    for cap in caps:
+        buffer = TextBuffer(document(10 ** 6), history_bytes=cap)
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        start_time = time.perf_counter()
+        for method, argument in session:
+            getattr(buffer, method)(argument)
+        edited = time.perf_counter() - start_time
+        # includes the text the edits added; the 'no history' row
+        # shows how much of it that is
+        held = tracemalloc.get_traced_memory()[0] - baseline
+        tracemalloc.stop()
+
+        undos = 0
+        start_time = time.perf_counter()
+        while buffer.undo():
+            undos += 1
+        undone = time.perf_counter() - start_time
+        per_undo = undone / undos * 1e6 if undos else 0.0
+
+        label = 'no history' if cap is None else f"cap {cap:,} B"
+        print(f"{label:<20} {edits:,} edits  {edits / edited:9,.0f} edits/s  "
+              f"traced {held / 1024:9,.0f} KiB  "
+              f"{undos:>7,} undo steps  {per_undo:6.1f} us/undo")
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [2 * 10 ** 5, 2 * 10 ** 6]
+    for n in sizes:
+        compare(n)
+        middle_edits(n)
+        keystroke_replay(n)
+    undo_history()
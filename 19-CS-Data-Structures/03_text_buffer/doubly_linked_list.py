@@ -1,140 +1,360 @@
-"""Each ListNode holds a reference to its previous node
-as well as its next node in the List."""
+import heapq
+import itertools
+
+
 class ListNode:
+    """Each ListNode holds a reference to its previous node
+    as well as its next node in the List."""
+    __slots__ = ('value', 'prev', 'next')  # no per-node __dict__
+
     def __init__(self, value, prev=None, next=None):
         self.value = value
         self.prev = prev
         self.next = next
 
-    """Wrap the given value in a ListNode and insert it
-    after this node. Note that this node could already
-    have a next node it is pointing to."""
     def insert_after(self, value):
+        """Wrap the given value in a ListNode and insert it
+        after this node. Note that this node could already
+        have a next node it is pointing to."""
         current_next = self.next
         self.next = ListNode(value, self, current_next)
         if current_next:
             current_next.prev = self.next
 
-    """Wrap the given value in a ListNode and insert it
-    before this node. Note that this node could already
-    have a previous node it is pointing to."""
     def insert_before(self, value):
+        """Wrap the given value in a ListNode and insert it
+        before this node. Note that this node could already
+        have a previous node it is pointing to."""
         current_prev = self.prev
         self.prev = ListNode(value, current_prev, self)
         if current_prev:
             current_prev.next = self.prev
 
-    """Rearranges this ListNode's previous and next pointers
-    accordingly, effectively deleting this ListNode."""
     def delete(self):
+        """Rearranges this ListNode's previous and next pointers
+        accordingly, effectively deleting this ListNode."""
         if self.prev:
             self.prev.next = self.next
         if self.next:
             self.next.prev = self.prev
 
-"""Our doubly-linked list class. It holds references to
-the list's head and tail nodes."""
+
+class NodePool:
+    """Free list of released ListNodes. Lists that share a pool hand
+    their removed nodes back to it and take new nodes from it before
+    allocating, so steady add/remove churn stops allocating.
+
+    A node is wiped and reused as soon as its list removes it, so
+    don't keep handles to removed nodes of a pooled list."""
+    def __init__(self):
+        self.free = None  # released nodes, chained through .next
+        self.free_count = 0
+        self.allocated = 0
+        self.reused = 0
+
+    def acquire(self, value):
+        node = self.free
+        if node is None:
+            self.allocated += 1
+            return ListNode(value)
+
+        self.free = node.next
+        self.free_count -= 1
+        self.reused += 1
+        node.value = value
+        node.next = None
+        return node
+
+    def release(self, node):
+        node.value = None
+        node.prev = None
+        node.next = self.free
+        self.free = node
+        self.free_count += 1
+
+
+class _Reversed:
+    """Wraps a value so heapq's min-heap orders it largest first."""
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+
 class DoublyLinkedList:
-    def __init__(self, node=None):
+    """Our doubly-linked list class. It holds references to
+    the list's head and tail nodes. Pass a NodePool to recycle
+    removed nodes instead of allocating a new one per add.
+
+    With track_extrema=True the list keeps a max-heap and a min-heap
+    of its values, so get_max and get_min are O(1) amortized instead
+    of a full scan. Removed values are dropped from the heaps lazily,
+    which requires hashable values that aren't mutated in place."""
+    def __init__(self, node=None, pool=None, track_extrema=False):
         self.head = node
         self.tail = node
         self.length = 1 if node else 0
+        self.pool = pool
+
+        self.track_extrema = track_extrema
+        if track_extrema:
+            self._max_heap = []
+            self._min_heap = []
+            # value -> number of removed copies still sitting in each heap
+            self._stale_max = {}
+            self._stale_min = {}
+            if node:
+                self._track_add(node.value)
+
+    @classmethod
+    def from_iterable(cls, values, pool=None, track_extrema=False):
+        """Build a list from values in one pass."""
+        dll = cls(pool=pool, track_extrema=track_extrema)
+        dll.extend(values)
+        return dll
 
     def __len__(self):
         return self.length
 
-    def add_to_head(self, value):
-        new_node = ListNode(value)
-        self.length += 1
-        if not self.head and not self.tail:
-            self.head = new_node
-            self.tail = new_node
+    def __iter__(self):
+        current = self.head
+        while current:
+            yield current.value
+            current = current.next
+
+    def __reversed__(self):
+        current = self.tail
+        while current:
+            yield current.value
+            current = current.prev
+
+    def __getitem__(self, index):
+        """The value at index, walking from the nearer end. A slice
+        returns a new DoublyLinkedList, streamed in one pass without an
+        intermediate Python list."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.length)
+            if step > 0:
+                values = itertools.islice(self, start, stop, step)
+            else:
+                last = self.length - 1
+                values = itertools.islice(reversed(self), last - start,
+                                          last - stop, -step)
+            return type(self).from_iterable(values)
+
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError('DoublyLinkedList index out of range')
+        if index < self.length // 2:
+            current = self.head
+            for _ in range(index):
+                current = current.next
         else:
-            self.head.prev = new_node
-            new_node.next = self.head
-            self.head = new_node
+            current = self.tail
+            for _ in range(self.length - 1 - index):
+                current = current.prev
+        return current.value
 
-    def remove_from_head(self):
-        if not self.head:
-            return None
-        self.length -= 1
+    def extend(self, values):
+        """Add every value to the tail. The new nodes are chained
+        together first and linked to the tail once at the end."""
+        first = last = None
+        count = 0
+        for value in values:
+            node = self._new_node(value)
+            if last is None:
+                first = node
+            else:
+                last.next = node
+                node.prev = last
+            last = node
+            count += 1
+            if self.track_extrema:
+                self._track_add(value)
+
+        if first is not None:
+            self._link_chain(first, last, count)
+
+    def splice(self, other):
+        """Move every node of other to the end of this list in O(1)
+        and leave other empty. When this list tracks extrema the
+        moved values still have to be added to its heaps."""
+        if other is self or not other.head:
+            return
 
-        if self.head is self.tail:
-            current_head = self.head
-            self.head = None
-            self.tail = None
-            return current_head.value
+        if self.track_extrema:
+            for value in other:
+                self._track_add(value)
+        if other.track_extrema:
+            other._max_heap, other._min_heap = [], []
+            other._stale_max, other._stale_min = {}, {}
+
+        self._link_chain(other.head, other.tail, other.length)
+        other.head = None
+        other.tail = None
+        other.length = 0
+
+    def _link_chain(self, first, last, count):
+        first.prev = self.tail
+        if self.tail:
+            self.tail.next = first
         else:
-            current_head = self.head
-            self.head = self.head.next
-            self.head.prev = None
-            return current_head.value
+            self.head = first
+        self.tail = last
+        self.length += count
 
-    def add_to_tail(self, value):
-        new_node = ListNode(value)
+    def _new_node(self, value):
+        if self.pool is None:
+            return ListNode(value)
+        return self.pool.acquire(value)
+
+    def _release(self, node):
+        if self.pool is not None:
+            self.pool.release(node)
+
+    def _link_head(self, node):
+        node.prev = None
+        node.next = self.head
+        if self.head:
+            self.head.prev = node
+        else:
+            self.tail = node
+        self.head = node
         self.length += 1
 
-        if not self.head and not self.tail:
-            self.head = new_node
-            self.tail = new_node
+    def _link_tail(self, node):
+        node.next = None
+        node.prev = self.tail
+        if self.tail:
+            self.tail.next = node
+        else:
+            self.head = node
+        self.tail = node
+        self.length += 1
 
+    def _unlink(self, node):
+        """Detach node from this list in O(1), wherever it sits.
+        The node must belong to this list."""
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
         else:
-            self.tail.next = new_node
-            new_node.prev = self.tail
-            self.tail = new_node
+            self.tail = node.prev
+        node.prev = None
+        node.next = None
+        self.length -= 1
+
+    def _track_add(self, value):
+        heapq.heappush(self._max_heap, _Reversed(value))
+        heapq.heappush(self._min_heap, value)
+
+    def _track_remove(self, value):
+        self._stale_max[value] = self._stale_max.get(value, 0) + 1
+        self._stale_min[value] = self._stale_min.get(value, 0) + 1
+
+        # rebuild once stale entries outnumber live ones, so the
+        # heaps stay O(n) and the rebuild cost is amortized
+        if len(self._min_heap) > 2 * self.length + 32:
+            values = []
+            current = self.head
+            while current:
+                values.append(current.value)
+                current = current.next
+            self._max_heap = [_Reversed(value) for value in values]
+            self._min_heap = values
+            heapq.heapify(self._max_heap)
+            heapq.heapify(self._min_heap)
+            self._stale_max = {}
+            self._stale_min = {}
+
+    @staticmethod
+    def _heap_top(heap, stale, unwrap=False):
+        # discard heap entries whose value has since been removed
+        while heap:
+            value = heap[0].value if unwrap else heap[0]
+            count = stale.get(value)
+            if not count:
+                return value
+            heapq.heappop(heap)
+            if count == 1:
+                del stale[value]
+            else:
+                stale[value] = count - 1
+        return None
+
+    def add_to_head(self, value):
+        self._link_head(self._new_node(value))
+        if self.track_extrema:
+            self._track_add(value)
+
+    def remove_from_head(self):
+        if not self.head:
+            return None
+
+        current_head = self.head
+        self._unlink(current_head)
+        value = current_head.value
+        self._release(current_head)
+        if self.track_extrema:
+            self._track_remove(value)
+        return value
+
+    def add_to_tail(self, value):
+        self._link_tail(self._new_node(value))
+        if self.track_extrema:
+            self._track_add(value)
 
     def remove_from_tail(self):
         if not self.tail:
             return None
 
-        self.length -= 1
-
-        if self.head is self.tail:
-            current_tail = self.tail
-            self.head = None
-            self.tail = None
-            return current_tail.value
-        else:
-            current_tail = self.tail
-            self.tail = self.tail.prev
-            self.tail.next = None
-            return current_tail.value
+        current_tail = self.tail
+        self._unlink(current_tail)
+        value = current_tail.value
+        self._release(current_tail)
+        if self.track_extrema:
+            self._track_remove(value)
+        return value
 
     def move_to_front(self, node):
+        """Relink node at the head. The node object itself moves, so
+        handles to it stay valid."""
         if node is self.head:
             return
 
-        if node is self.tail:
-            self.remove_from_tail()
-        else:
-            node.delete()
-            self.length -= 1
-
-        self.add_to_head(node.value)
+        self._unlink(node)
+        self._link_head(node)
 
     def move_to_end(self, node):
+        """Relink node at the tail. The node object itself moves, so
+        handles to it stay valid."""
         if node is self.tail:
             return
 
-        if node is self.head:
-            self.remove_from_head()
-        else:
-            node.delete()
-            self.length -= 1
-
-        self.add_to_tail(node.value)
+        self._unlink(node)
+        self._link_tail(node)
 
     def delete(self, node):
-        # TODO: what if node is not in list? what if it's in the middle?
-        if self.head is self.tail or self.head is node:
-            self.remove_from_head()  # taking advantage of existing method
-            # TODO: investigate memory leak by leaving extra nodes around
-        elif self.tail is node:
-            self.remove_from_tail()
+        """Remove node in O(1), whether it is the head, the tail or
+        somewhere in the middle. The node must belong to this list."""
+        self._unlink(node)
+        if self.track_extrema:
+            self._track_remove(node.value)
+        self._release(node)
 
     def get_max(self):
         if not self.head:
             return None
+        if self.track_extrema:
+            return self._heap_top(self._max_heap, self._stale_max,
+                                  unwrap=True)
 
         max_value = self.head.value
         current = self.head
@@ -144,3 +364,18 @@ class DoublyLinkedList:
             current = current.next
 
         return max_value
+
+    def get_min(self):
+        if not self.head:
+            return None
+        if self.track_extrema:
+            return self._heap_top(self._min_heap, self._stale_min)
+
+        min_value = self.head.value
+        current = self.head
+        while current:
+            if current.value < min_value:
+                min_value = current.value
+            current = current.next
+
+        return min_value
@@ -0,0 +1,144 @@
+"""TextBuffer backed by a gap buffer, for edits clustered around a cursor.
+
+The text lives in one array of characters with a gap of unused slots at
+the cursor. Typing fills the gap and deleting widens it, both O(1);
+moving the cursor copies only the characters it passes over. When the
+gap runs out the array doubles, so inserts are amortized O(1).
+"""
+import sys
+from array import array
+
+# 'u' is deprecated from Python 3.13 in favour of 'w' (always 4 bytes)
+TYPECODE = 'w' if sys.version_info >= (3, 13) else 'u'
+MIN_CAPACITY = 64
+
+
+class GapTextBuffer:
+    """Drop-in replacement for TextBuffer with a movable cursor.
+
+    write, backspace and delete_forward edit at the cursor. The
+    TextBuffer methods move the cursor to the end they work on first:
+    after append the cursor is at the end of the text, after prepend
+    it is just past the prepended text.
+    """
+    def __init__(self, init=None, capacity=MIN_CAPACITY):
+        self.buffer = array(TYPECODE, '\0') * max(capacity, 1)
+        self.gap_start = 0  # the cursor: first slot of the gap
+        self.gap_end = len(self.buffer)  # first slot after the gap
+
+        if init:
+            self.append(init)
+
+    def __len__(self):
+        return len(self.buffer) - (self.gap_end - self.gap_start)
+
+    def __str__(self):
+        return (self.buffer[:self.gap_start].tounicode()
+                + self.buffer[self.gap_end:].tounicode())
+
+    @property
+    def cursor(self):
+        return self.gap_start
+
+    def move_cursor(self, pos):
+        """Move the cursor to pos, shifting the characters between the
+        old and new position across the gap."""
+        if not 0 <= pos <= len(self):
+            raise IndexError('cursor position out of range')
+
+        buffer = self.buffer
+        if pos < self.gap_start:
+            moved = self.gap_start - pos
+            buffer[self.gap_end - moved:self.gap_end] = buffer[pos:self.gap_start]
+            self.gap_start = pos
+            self.gap_end -= moved
+        elif pos > self.gap_start:
+            moved = pos - self.gap_start
+            buffer[self.gap_start:pos] = \
+                buffer[self.gap_end:self.gap_end + moved]
+            self.gap_start = pos
+            self.gap_end += moved
+
+    def _grow(self, needed):
+        # copy into an array at least twice as large, keeping the gap
+        # at the cursor
+        size = len(self)
+        capacity = max(2 * len(self.buffer), size + needed)
+        tail = self.buffer[self.gap_end:]
+        grown = self.buffer[:self.gap_start]
+        grown.extend(array(TYPECODE, '\0') * (capacity - size))
+        grown.extend(tail)
+        self.buffer = grown
+        self.gap_end = capacity - len(tail)
+
+    def write(self, string_to_add):
+        """Insert at the cursor and move the cursor past the new text."""
+        count = len(string_to_add)
+        if self.gap_end - self.gap_start < count:
+            self._grow(count)
+        self.buffer[self.gap_start:self.gap_start + count] = \
+            array(TYPECODE, string_to_add)
+        self.gap_start += count
+
+    def backspace(self, chars_to_remove=1):
+        """Remove up to chars_to_remove characters before the cursor."""
+        self.gap_start -= max(0, min(chars_to_remove, self.gap_start))
+
+    def delete_forward(self, chars_to_remove=1):
+        """Remove up to chars_to_remove characters after the cursor."""
+        self.gap_end += max(0, min(chars_to_remove,
+                                   len(self.buffer) - self.gap_end))
+
+    def insert(self, pos, string_to_add):
+        self.move_cursor(pos)
+        self.write(string_to_add)
+
+    def delete(self, pos, chars_to_remove):
+        self.move_cursor(pos)
+        self.delete_forward(chars_to_remove)
+
+    def append(self, string_to_add):
+        self.move_cursor(len(self))
+        self.write(string_to_add)
+
+    def prepend(self, string_to_add):
+        self.move_cursor(0)
+        self.write(string_to_add)
+
+    def delete_front(self, chars_to_remove: int):
+        self.move_cursor(0)
+        self.delete_forward(chars_to_remove)
+
+    def delete_back(self, chars_to_remove: int):
+        self.move_cursor(len(self))
+        self.backspace(chars_to_remove)
+
+    def join(self, other_buffer):
+        """Join other_buffer to the end of self. A gap buffer can't
+        share storage, so this copies the other text (O(len(other)));
+        other_buffer is left empty, as with TextBuffer."""
+        if not isinstance(other_buffer, GapTextBuffer):
+            raise Exception('Error: Argument is not a gap text buffer')
+        elif other_buffer is self:
+            raise Exception('Error: Cannot join a buffer to itself')
+        elif len(other_buffer) == 0:
+            raise Exception('Error: Other buffer is empty')
+
+        self.append(str(other_buffer))
+        other_buffer.buffer = array(TYPECODE, '\0') * MIN_CAPACITY
+        other_buffer.gap_start = 0
+        other_buffer.gap_end = MIN_CAPACITY
+
+
+if __name__ in "__main__":
+    text = GapTextBuffer("Super")
+    print(text)
+
+    text.append(" is ")
+    text.join(GapTextBuffer("weird."))
+    print(text)
+
+    text.move_cursor(5)
+    text.write(" text")
+    text.backspace(4)
+    print(text, text.cursor)
@@ -0,0 +1,197 @@
+"""TextBuffer backed by a rope: a balanced binary tree whose leaves hold
+string chunks of up to CHUNK characters.
+
+Every internal node stores the length of its subtree, so a position can
+be found in O(log n), and concatenation joins two trees AVL-style in
+O(log n). Nodes are never modified after they are built; edits build
+new nodes along one path and share everything else.
+"""
+CHUNK = 512  # longest string kept in one leaf
+
+
+class Leaf:
+    __slots__ = ('text', 'length', 'height')
+
+    def __init__(self, text):
+        self.text = text
+        self.length = len(text)
+        self.height = 0
+
+
+class Node:
+    __slots__ = ('left', 'right', 'length', 'height')
+
+    def __init__(self, left, right):
+        self.left = left
+        self.right = right
+        self.length = left.length + right.length
+        self.height = 1 + max(left.height, right.height)
+
+
+def _leaf(text):
+    return Leaf(text) if text else None
+
+
+def build(text):
+    """Balanced rope for text, CHUNK characters per leaf, or None."""
+    leaves = [Leaf(text[i:i + CHUNK]) for i in range(0, len(text), CHUNK)]
+
+    # halving the leaf range keeps sibling leaf counts within one of
+    # each other, so their heights differ by at most one, as concat
+    # expects (pairing leaves level by level doesn't: an odd leaf
+    # carried up can end up two levels short of its sibling)
+    def build_range(lo, hi):
+        if hi - lo == 1:
+            return leaves[lo]
+        mid = (lo + hi) // 2
+        return Node(build_range(lo, mid), build_range(mid, hi))
+
+    return build_range(0, len(leaves)) if leaves else None
+
+
+def _balanced(left, right):
+    # Node(left, right) for subtrees whose heights differ by at most 2,
+    # rotating (with new nodes) to restore the AVL invariant
+    if left.height > right.height + 1:
+        if left.left.height < left.right.height:
+            pivot = left.right
+            return Node(Node(left.left, pivot.left),
+                        Node(pivot.right, right))
+        return Node(left.left, Node(left.right, right))
+    if right.height > left.height + 1:
+        if right.right.height < right.left.height:
+            pivot = right.left
+            return Node(Node(left, pivot.left),
+                        Node(pivot.right, right.right))
+        return Node(Node(left, right.left), right.right)
+    return Node(left, right)
+
+
+def concat(left, right):
+    """Rope for left followed by right, in O(|h1 - h2| + 1). Short
+    leaves meeting at the seam are merged, so many small appends don't
+    leave one leaf per call."""
+    if left is None:
+        return right
+    if right is None:
+        return left
+
+    if type(left) is Leaf and type(right) is Leaf:
+        if left.length + right.length <= CHUNK:
+            return Leaf(left.text + right.text)
+        return Node(left, right)
+
+    # walk down the taller side (or past a leaf) until the two are level
+    if left.height > right.height + 1 or type(right) is Leaf:
+        return _balanced(left.left, concat(left.right, right))
+    if right.height > left.height + 1 or type(left) is Leaf:
+        return _balanced(concat(left, right.left), right.right)
+    return Node(left, right)
+
+
+def split(rope, pos):
+    """(first pos characters, the rest), in O(log n)."""
+    if rope is None:
+        return None, None
+    if type(rope) is Leaf:
+        return _leaf(rope.text[:pos]), _leaf(rope.text[pos:])
+
+    left_length = rope.left.length
+    if pos == left_length:
+        return rope.left, rope.right
+    if pos < left_length:
+        first, rest = split(rope.left, pos)
+        return first, concat(rest, rope.right)
+    first, rest = split(rope.right, pos - left_length)
+    return concat(rope.left, first), rest
+
+
+def chunks(rope):
+    """Yield the leaf strings from left to right."""
+    stack = [rope] if rope is not None else []
+    while stack:
+        node = stack.pop()
+        if type(node) is Leaf:
+            yield node.text
+        else:
+            stack.append(node.right)
+            stack.append(node.left)
+
+
+class RopeTextBuffer:
+    """Drop-in replacement for TextBuffer that also supports editing
+    in the middle of the text.
+
+    append, prepend, insert, delete and join are all O(log n) however
+    long the added text is (plus O(len(text)) to chunk new text), and
+    str() is a single linear join of the leaves.
+    """
+    def __init__(self, init=None):
+        self.root = None
+
+        if init:
+            self.append(init)
+
+    def __len__(self):
+        return self.root.length if self.root else 0
+
+    def __str__(self):
+        return "".join(chunks(self.root))
+
+    def append(self, string_to_add):
+        self.root = concat(self.root, build(string_to_add))
+
+    def prepend(self, string_to_add):
+        self.root = concat(build(string_to_add), self.root)
+
+    def insert(self, pos, string_to_add):
+        if not 0 <= pos <= len(self):
+            raise IndexError('insert position out of range')
+        first, rest = split(self.root, pos)
+        self.root = concat(concat(first, build(string_to_add)), rest)
+
+    def delete(self, pos, chars_to_remove):
+        """Remove up to chars_to_remove characters starting at pos."""
+        if not 0 <= pos <= len(self):
+            raise IndexError('delete position out of range')
+        chars_to_remove = max(0, chars_to_remove)
+        first, rest = split(self.root, pos)
+        _, rest = split(rest, chars_to_remove)
+        self.root = concat(first, rest)
+
+    def delete_front(self, chars_to_remove: int):
+        self.delete(0, chars_to_remove)
+
+    def delete_back(self, chars_to_remove: int):
+        chars_to_remove = max(0, chars_to_remove)
+        self.delete(max(0, len(self) - chars_to_remove), chars_to_remove)
+
+    def join(self, other_buffer):
+        """Join other_buffer to the end of self in O(log n). The
+        other buffer's tree is moved, not copied, so other_buffer is
+        left empty."""
+        if not isinstance(other_buffer, RopeTextBuffer):
+            raise Exception('Error: Argument is not a rope text buffer')
+        elif other_buffer is self:
+            raise Exception('Error: Cannot join a buffer to itself')
+        elif len(other_buffer) == 0:
+            raise Exception('Error: Other buffer is empty')
+
+        self.root = concat(self.root, other_buffer.root)
+        other_buffer.root = None
+
+
+if __name__ in "__main__":
+    text = RopeTextBuffer("Super")
+    print(text)
+
+    text.append(" is ")
+    text.join(RopeTextBuffer("weird."))
+    print(text)
+
+    text.insert(5, "text")
+    print(text)
+
+    text.delete(0, 5)
+    text.prepend("Hey! ")
+    print(text)
@@ -0,0 +1,90 @@
+import random
+import unittest
+from gap_text_buffer import GapTextBuffer
+
+class GapTextBufferTests(unittest.TestCase):
+  def setUp(self):
+    self.buffer = GapTextBuffer("Super", capacity=4)
+
+  def test_text_buffer_api(self):
+    self.buffer.append(" is ")
+    self.buffer.join(GapTextBuffer("weird."))
+    self.assertEqual(str(self.buffer), "Super is weird.")
+    self.buffer.delete_back(6)
+    self.buffer.prepend("Hey! ")
+    self.assertEqual(str(self.buffer), "Hey! Super is ")
+    self.buffer.delete_front(5)
+    self.assertEqual(str(self.buffer), "Super is ")
+    self.assertEqual(len(self.buffer), 9)
+
+  def test_empty_buffer(self):
+    empty = GapTextBuffer()
+    self.assertEqual(str(empty), "")
+    self.assertEqual(len(empty), 0)
+    empty.delete_back(3)
+    empty.delete_front(3)
+    self.assertEqual(str(empty), "")
+    self.assertRaises(Exception, self.buffer.join, empty)
+
+  def test_join_empties_other_buffer(self):
+    other = GapTextBuffer("!")
+    self.buffer.join(other)
+    self.assertEqual(str(self.buffer), "Super!")
+    self.assertEqual(len(other), 0)
+    other.append("again")
+    self.assertEqual(str(other), "again")
+
+  def test_join_to_itself_is_rejected(self):
+    self.assertRaises(Exception, self.buffer.join, self.buffer)
+    self.assertEqual(str(self.buffer), "Super")
+
+  def test_cursor_editing(self):
+    self.assertEqual(self.buffer.cursor, 5)  # after the initial append
+    self.buffer.move_cursor(2)
+    self.buffer.write("--")
+    self.assertEqual(self.buffer.cursor, 4)
+    self.assertEqual(str(self.buffer), "Su--per")
+    self.buffer.backspace()
+    self.buffer.delete_forward(2)
+    self.assertEqual(str(self.buffer), "Su-r")
+    self.buffer.backspace(10)
+    self.assertEqual(str(self.buffer), "r")
+    self.assertEqual(self.buffer.cursor, 0)
+    self.buffer.delete_forward(10)
+    self.assertEqual(str(self.buffer), "")
+    self.assertRaises(IndexError, self.buffer.move_cursor, 1)
+
+  def test_negative_deletes_remove_nothing(self):
+    self.buffer.move_cursor(2)
+    self.buffer.backspace(-1)
+    self.buffer.delete_forward(-1)
+    self.buffer.delete_front(-1)
+    self.buffer.delete_back(-1)
+    self.assertEqual(str(self.buffer), "Super")
+    self.assertEqual(len(self.buffer), 5)
+
+  def test_prepend_leaves_cursor_after_new_text(self):
+    self.buffer.prepend("ab")
+    self.assertEqual(self.buffer.cursor, 2)
+    self.buffer.write("c")
+    self.assertEqual(str(self.buffer), "abcSuper")
+
+  def test_random_edits_match_str(self):
+    rng = random.Random(5)
+    buffer = GapTextBuffer(capacity=1)
+    expected = ""
+    for step in range(3000):
+      pos = rng.randint(0, len(expected))
+      if rng.random() < 0.6:
+        text = str(step) * rng.choice((1, 1, 30))
+        buffer.insert(pos, text)
+        expected = expected[:pos] + text + expected[pos:]
+      else:
+        count = rng.randint(0, 40)
+        buffer.delete(pos, count)
+        expected = expected[:pos] + expected[pos + count:]
+      self.assertEqual(len(buffer), len(expected))
+    self.assertEqual(str(buffer), expected)
+
+if __name__ == '__main__':
+  unittest.main()
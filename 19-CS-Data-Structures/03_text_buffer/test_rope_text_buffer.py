@@ -0,0 +1,111 @@
+import random
+import unittest
+import rope_text_buffer
+from rope_text_buffer import RopeTextBuffer
+
+class RopeTextBufferTests(unittest.TestCase):
+  def setUp(self):
+    self.buffer = RopeTextBuffer("Super")
+
+  def assertBalanced(self, rope):
+    if type(rope) is rope_text_buffer.Leaf:
+      self.assertLessEqual(rope.length, rope_text_buffer.CHUNK)
+      return 0
+    left = self.assertBalanced(rope.left)
+    right = self.assertBalanced(rope.right)
+    self.assertLessEqual(abs(left - right), 1)
+    self.assertEqual(rope.height, 1 + max(left, right))
+    self.assertEqual(rope.length, rope.left.length + rope.right.length)
+    return rope.height
+
+  def test_build_is_balanced(self):
+    for leaves in range(1, 40):
+      text = "".join(chr(97 + i % 26) * rope_text_buffer.CHUNK
+                     for i in range(leaves))
+      rope = rope_text_buffer.build(text)
+      self.assertBalanced(rope)
+      self.assertEqual("".join(rope_text_buffer.chunks(rope)), text)
+
+  def test_text_buffer_api(self):
+    self.buffer.append(" is ")
+    self.buffer.join(RopeTextBuffer("weird."))
+    self.assertEqual(str(self.buffer), "Super is weird.")
+    self.buffer.delete_back(6)
+    self.buffer.prepend("Hey! ")
+    self.assertEqual(str(self.buffer), "Hey! Super is ")
+    self.buffer.delete_front(5)
+    self.assertEqual(str(self.buffer), "Super is ")
+    self.assertEqual(len(self.buffer), 9)
+
+  def test_empty_buffer(self):
+    empty = RopeTextBuffer()
+    self.assertEqual(str(empty), "")
+    self.assertEqual(len(empty), 0)
+    empty.delete_back(3)
+    empty.delete_front(3)
+    self.assertEqual(str(empty), "")
+    self.assertRaises(Exception, self.buffer.join, empty)
+
+  def test_join_moves_other_buffer(self):
+    other = RopeTextBuffer("!")
+    self.buffer.join(other)
+    self.assertEqual(str(self.buffer), "Super!")
+    self.assertEqual(len(other), 0)
+
+  def test_join_to_itself_is_rejected(self):
+    self.assertRaises(Exception, self.buffer.join, self.buffer)
+    self.assertEqual(str(self.buffer), "Super")
+
+  def test_deletes_past_the_end_empty_the_buffer(self):
+    self.buffer.delete_back(50)
+    self.assertEqual(str(self.buffer), "")
+    self.buffer.append("abc")
+    self.buffer.delete_front(50)
+    self.assertEqual(str(self.buffer), "")
+
+  def test_negative_deletes_remove_nothing(self):
+    self.buffer.delete_front(-1)
+    self.buffer.delete_back(-1)
+    self.buffer.delete(2, -3)
+    self.assertEqual(str(self.buffer), "Super")
+
+  def test_insert_and_delete_in_the_middle(self):
+    self.buffer.insert(2, "--")
+    self.assertEqual(str(self.buffer), "Su--per")
+    self.buffer.insert(7, "!")
+    self.buffer.insert(0, ">")
+    self.assertEqual(str(self.buffer), ">Su--per!")
+    self.buffer.delete(3, 2)
+    self.assertEqual(str(self.buffer), ">Super!")
+    self.assertRaises(IndexError, self.buffer.insert, 20, "x")
+    self.assertRaises(IndexError, self.buffer.delete, -1, 1)
+
+  def test_random_edits_match_str(self):
+    rng = random.Random(3)
+    buffer = RopeTextBuffer()
+    expected = ""
+    for step in range(2000):
+      pos = rng.randint(0, len(expected))
+      if rng.random() < 0.6:
+        text = str(step) * rng.choice((1, 1, 50, 400))
+        buffer.insert(pos, text)
+        expected = expected[:pos] + text + expected[pos:]
+      else:
+        count = rng.randint(0, 300)
+        buffer.delete(pos, count)
+        expected = expected[:pos] + expected[pos + count:]
+      self.assertEqual(len(buffer), len(expected))
+    self.assertEqual(str(buffer), expected)
+    self.assertBalanced(buffer.root)
+
+  def test_small_appends_share_leaves(self):
+    buffer = RopeTextBuffer()
+    for _ in range(10000):
+      buffer.append("x")
+    self.assertEqual(str(buffer), "x" * 10000)
+    self.assertBalanced(buffer.root)
+    leaves = list(rope_text_buffer.chunks(buffer.root))
+    self.assertLessEqual(len(leaves), 2 * 10000 // rope_text_buffer.CHUNK + 1)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,196 @@
+import random
+import unittest
+from text_buffer import TextBuffer, CHUNK, COALESCE_LIMIT
+
+class TextBufferTests(unittest.TestCase):
+  def setUp(self):
+    self.buffer = TextBuffer("Super")
+
+  def assertChunked(self, buffer):
+    chunks = list(buffer.contents)
+    self.assertTrue(all(0 < len(chunk) <= CHUNK for chunk in chunks))
+    self.assertEqual(sum(map(len, chunks)), len(buffer))
+
+  def test_text_buffer_api(self):
+    self.buffer.append(" is ")
+    self.buffer.join(TextBuffer("weird."))
+    self.assertEqual(str(self.buffer), "Super is weird.")
+    self.buffer.delete_back(6)
+    self.buffer.prepend("Hey! ")
+    self.assertEqual(str(self.buffer), "Hey! Super is ")
+    self.buffer.delete_front(5)
+    self.assertEqual(str(self.buffer), "Super is ")
+    self.assertEqual(len(self.buffer), 9)
+
+  def test_empty_buffer(self):
+    empty = TextBuffer()
+    self.assertEqual(str(empty), "")
+    empty.delete_back(3)
+    empty.delete_front(3)
+    self.assertEqual(len(empty), 0)
+    self.assertRaises(Exception, self.buffer.join, empty)
+
+  def test_appends_fill_chunks(self):
+    buffer = TextBuffer()
+    for _ in range(10 * CHUNK):
+      buffer.append("x")
+    self.assertEqual(len(buffer.contents), 10)
+    buffer.append("y" * (3 * CHUNK + 1))
+    self.assertEqual(len(buffer.contents), 14)
+    self.assertEqual(str(buffer), "x" * 10 * CHUNK + "y" * (3 * CHUNK + 1))
+    self.assertChunked(buffer)
+
+  def test_prepend_keeps_order_across_chunks(self):
+    text = "".join(map(str, range(2000)))
+    self.buffer.prepend(text)
+    self.assertEqual(str(self.buffer), text + "Super")
+    self.assertChunked(self.buffer)
+
+  def test_deletes_trim_inside_chunks(self):
+    buffer = TextBuffer("a" * CHUNK + "b" * CHUNK + "c" * CHUNK)
+    buffer.delete_front(CHUNK + 10)
+    buffer.delete_back(5)
+    self.assertEqual(str(buffer), "b" * (CHUNK - 10) + "c" * (CHUNK - 5))
+    self.assertChunked(buffer)
+    buffer.delete_back(10 ** 6)
+    self.assertEqual(str(buffer), "")
+    self.assertEqual(len(buffer), 0)
+
+  def test_short_chunks_merge(self):
+    buffer = TextBuffer("a" * CHUNK + "b" * CHUNK)
+    buffer.delete_front(CHUNK - 1)
+    buffer.delete_back(CHUNK - 1)
+    self.assertEqual(len(buffer.contents), 1)
+    self.assertEqual(str(buffer), "ab")
+
+  def test_join_moves_chunks(self):
+    other = TextBuffer("x" * (5 * CHUNK))
+    chunks = len(other.contents)
+    self.buffer.join(other)
+    self.assertEqual(len(self.buffer), 5 + 5 * CHUNK)
+    self.assertEqual(len(other), 0)
+    self.assertEqual(len(other.contents), 0)
+    self.assertEqual(len(self.buffer.contents), chunks + 1)
+    self.assertEqual(str(self.buffer), "Super" + "x" * (5 * CHUNK))
+
+  def test_indexing_and_slicing(self):
+    text = "".join(map(str, range(400)))
+    self.buffer = TextBuffer(text)
+    self.buffer.prepend("ab")
+    text = "ab" + text
+    self.assertGreater(len(self.buffer.contents), 2)
+    for i in (0, 1, CHUNK - 1, CHUNK, CHUNK + 1, len(text) - 1, -1, -CHUNK):
+      self.assertEqual(self.buffer[i], text[i])
+    self.assertRaises(IndexError, lambda: self.buffer[len(text)])
+    self.assertRaises(IndexError, lambda: self.buffer[-len(text) - 1])
+    for s in (slice(None), slice(CHUNK - 3, CHUNK + 3), slice(5, 3 * CHUNK),
+              slice(-10, None), slice(1, 900, 7), slice(None, None, -1),
+              slice(2 * CHUNK, 3, -5), slice(7, 7), slice(-5000, 5000)):
+      self.assertEqual(self.buffer[s], text[s])
+
+  def test_join_to_itself_is_rejected(self):
+    self.assertRaises(Exception, self.buffer.join, self.buffer)
+    self.assertEqual(str(self.buffer), "Super")
+
+  def test_random_edits_match_str(self):
+    rng = random.Random(8)
+    buffer = TextBuffer()
+    expected = ""
+    for step in range(2000):
+      text = str(step) * rng.choice((1, 1, 40, 300))
+      count = rng.randint(0, 400)
+      action = rng.randrange(4)
+      if action == 0:
+        buffer.append(text)
+        expected += text
+      elif action == 1:
+        buffer.prepend(text)
+        expected = text + expected
+      elif action == 2:
+        buffer.delete_front(count)
+        expected = expected[count:]
+      else:
+        buffer.delete_back(count)
+        expected = expected[:max(0, len(expected) - count)]
+      self.assertEqual(len(buffer), len(expected))
+    self.assertEqual(str(buffer), expected)
+    self.assertChunked(buffer)
+
+class TextBufferHistoryTests(unittest.TestCase):
+  def setUp(self):
+    self.buffer = TextBuffer("Super", history_bytes=10 ** 6)
+
+  def test_history_is_off_by_default(self):
+    buffer = TextBuffer("Super")
+    buffer.append("!")
+    self.assertFalse(buffer.undo())
+    self.assertEqual(str(buffer), "Super!")
+
+  def test_undo_and_redo_every_edit(self):
+    states = [str(self.buffer)]
+    self.buffer.append(" is ")
+    states.append(str(self.buffer))
+    self.buffer.prepend("Hey! ")
+    states.append(str(self.buffer))
+    self.buffer.join(TextBuffer("weird." + "!" * 600))
+    states.append(str(self.buffer))
+    self.buffer.delete_back(300)
+    states.append(str(self.buffer))
+    self.buffer.delete_front(7)
+    states.append(str(self.buffer))
+
+    for state in reversed(states[:-1]):
+      self.assertTrue(self.buffer.undo())
+      self.assertEqual(str(self.buffer), state)
+      self.assertEqual(len(self.buffer), len(state))
+    self.assertFalse(self.buffer.undo())
+
+    for state in states[1:]:
+      self.assertTrue(self.buffer.redo())
+      self.assertEqual(str(self.buffer), state)
+    self.assertFalse(self.buffer.redo())
+
+  def test_new_edit_clears_redo(self):
+    self.buffer.append("!")
+    self.buffer.undo()
+    self.buffer.append("?")
+    self.assertFalse(self.buffer.redo())
+    self.assertEqual(str(self.buffer), "Super?")
+
+  def test_single_character_edits_coalesce(self):
+    for char in "abc":
+      self.buffer.append(char)
+    self.buffer.delete_back(1)
+    self.buffer.delete_back(1)
+    self.assertEqual(str(self.buffer), "Supera")
+
+    self.buffer.undo()  # both backspaces
+    self.assertEqual(str(self.buffer), "Superabc")
+    self.buffer.undo()  # all three characters
+    self.assertEqual(str(self.buffer), "Super")
+    self.buffer.redo()
+    self.assertEqual(str(self.buffer), "Superabc")
+
+  def test_coalescing_is_limited(self):
+    for _ in range(COALESCE_LIMIT + 1):
+      self.buffer.prepend("x")
+    self.buffer.undo()
+    self.assertEqual(str(self.buffer), "x" * COALESCE_LIMIT + "Super")
+    self.buffer.undo()
+    self.assertEqual(str(self.buffer), "Super")
+
+  def test_history_is_bounded(self):
+    buffer = TextBuffer(history_bytes=2000)
+    for step in range(1000):
+      buffer.append(f"{step} ")
+    self.assertLessEqual(buffer._history_size, 2000)
+    undone = 0
+    while buffer.undo():
+      undone += 1
+    self.assertGreater(undone, 0)
+    self.assertLess(undone, 1000)
+    # the oldest edits were dropped, so they stay applied
+    self.assertTrue(str(buffer).startswith("0 1 2 "))
+
+if __name__ == '__main__':
+  unittest.main()
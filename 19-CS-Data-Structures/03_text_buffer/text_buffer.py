@@ -1,57 +1,283 @@
+"""TextBuffer backed by a DoublyLinkedList of string chunks.
+
+Unlike the original exercise, join moves the other buffer's chunks
+instead of copying them, so other_buffer is left empty afterwards
+(as with the rope and gap buffers).
+"""
+import sys
+from collections import deque
+
 from doubly_linked_list import DoublyLinkedList
 
+CHUNK = 256  # longest string stored in one node
+COALESCE_LIMIT = 64  # most single-character edits merged into one undo
+
 
 class TextBuffer:
-    def __init__(self, init=None):
+    """Text stored as a DoublyLinkedList of string chunks of at most
+    CHUNK characters, rather than one node per character.
+
+    Appends fill the end chunk before starting new ones, deletes trim
+    inside the end chunks, and a chunk left short by a delete or join
+    is merged into its neighbour when they fit together, so an
+    append-heavy buffer holds about one node per CHUNK characters.
+
+    Pass history_bytes to enable undo and redo. Each edit records its
+    inverse (e.g. delete_back(3) for append("abc"), or the removed text
+    for a delete), never a copy of the whole buffer. Once the records
+    use more than history_bytes, the oldest are dropped. Runs of
+    single-character appends, prepends or deletes undo as one step.
+    """
+    def __init__(self, init=None, history_bytes=None):
         # check if an init string is provided
         # if so, put the contents of the init string in self.contents
         self.contents = DoublyLinkedList()
+        self.length = 0  # characters, not chunks
+
+        self.history_bytes = history_bytes  # None: no undo/redo
+        self._undo = deque()  # (method, argument) inverse edits
+        self._redo = deque()
+        self._history_size = 0
+        self._coalescing = None  # method of the last single-char edit
 
         if init:
-            self.append(init)
+            self._append(init)  # the initial text isn't undoable
+
+    def __len__(self):
+        return self.length
 
     def __str__(self):
         # needs to return a string to print
-        s = ""
-        current = self.contents.head
-        while current:
-            s += current.value
-            current = current.next
-        return s
+        return "".join(self.contents)
+
+    def __getitem__(self, index):
+        """A character or, for a slice, a string, as with str. Chunks
+        before the range are skipped by their length, so only the
+        characters in the range are copied."""
+        if isinstance(index, slice):
+            positions = range(*index.indices(self.length))
+            if not positions:
+                return ""
+            lo = min(positions[0], positions[-1])
+            hi = max(positions[0], positions[-1]) + 1
+            return self._span(lo, hi)[::index.step or 1]
+
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError('TextBuffer index out of range')
+        return self._span(index, index + 1)
+
+    def _span(self, lo, hi):
+        # the text in [lo, hi), gathered from the chunks it overlaps
+        pieces = []
+        offset = 0
+        for chunk in self.contents:
+            end = offset + len(chunk)
+            if end > lo:
+                pieces.append(chunk[max(0, lo - offset):hi - offset])
+            if end >= hi:
+                break
+            offset = end
+        return "".join(pieces)
 
     def append(self, string_to_add):
-        for char in string_to_add:
-            self.contents.add_to_tail(char)
+        self._edit('_append', string_to_add)
 
     def prepend(self, string_to_add):
-        # reverse the incoming string ot maintain correct
-        # order when adding to the front of the text buffer
-        for char in string_to_add[::-1]:
-            self.contents.add_to_head(char)
+        self._edit('_prepend', string_to_add)
 
     def delete_front(self, chars_to_remove: int):
-        for _ in range(chars_to_remove):
-            self.contents.remove_from_head()
+        self._edit('_delete_front', chars_to_remove)
 
     def delete_back(self, chars_to_remove: int):
-        for _ in range(chars_to_remove):
-            self.contents.remove_from_tail()
+        self._edit('_delete_back', chars_to_remove)
 
     def join(self, other_buffer):
         """Join other_buffer to self
         The input buffer gets concatenated to the end of this buffer
         The tail of the concatenated buffer will be the tail of the other buffer
         The head of the concatenated buffer will be the head of this buffer
+        The chunks are moved, not copied, so other_buffer is left empty.
+        Undoing a join removes the joined text from this buffer; it
+        doesn't refill other_buffer.
         """
         if not isinstance(other_buffer, TextBuffer):
             raise Exception('Error: Atgument is not a text buffer')
+        elif other_buffer is self:
+            raise Exception('Error: Cannot join a buffer to itself')
         elif other_buffer.contents.length == 0:
             raise Exception('Error: Other buffer is empty')
 
-        self.contents.tail.next = other_buffer.contents.head
-        other_buffer.contents.head.prev = self.contents.tail
-        self.contents.tail = other_buffer.contents.tail
-        self.contents.length += other_buffer.contents.length
+        self._edit('_join', other_buffer)
+
+    def undo(self):
+        """Revert the most recent edit. Returns False if there is
+        nothing left to undo."""
+        return self._step(self._undo, self._redo)
+
+    def redo(self):
+        """Reapply the most recently undone edit. Returns False if
+        there is nothing to redo; any new edit clears the redo log."""
+        return self._step(self._redo, self._undo)
+
+    def _step(self, source, target):
+        self._coalescing = None
+        if not source:
+            return False
+        op = source.pop()
+        self._history_size -= self._cost(op)
+        self._push(target, getattr(self, op[0])(op[1]))
+        return True
+
+    def _edit(self, method, argument):
+        inverse = getattr(self, method)(argument)
+        if self.history_bytes is None or not inverse[1]:
+            return  # no history, or nothing changed
+
+        if self._redo:
+            self._history_size -= sum(map(self._cost, self._redo))
+            self._redo.clear()
+
+        # one character added (string of length 1) or removed (1)
+        single = method != '_join' and \
+            (argument == 1 if method.startswith('_delete') else
+             len(argument) == 1)
+        if single and self._coalescing == method and self._undo:
+            if self._merge(inverse):
+                return
+        self._coalescing = method if single else None
+        self._push(self._undo, inverse)
+
+    def _merge(self, inverse):
+        # fold a single-character edit into the previous undo record
+        op = self._undo[-1]
+        method, last = op
+        merged = None
+        if method in ('_delete_back', '_delete_front'):  # undo of typing
+            if last < COALESCE_LIMIT:
+                merged = (method, last + 1)
+        elif len(last) < COALESCE_LIMIT:
+            # undo of deletes: restore the characters in text order
+            if method == '_append':  # deleting from the back
+                merged = (method, inverse[1] + last)
+            else:  # deleting from the front
+                merged = (method, last + inverse[1])
+        if merged is None:
+            return False
+
+        self._history_size -= self._cost(op)
+        self._undo[-1] = merged
+        self._history_size += self._cost(merged)
+        return True
+
+    @staticmethod
+    def _cost(op):
+        # approximate bytes held by one record
+        return sys.getsizeof(op) + sys.getsizeof(op[1])
+
+    def _push(self, log, op):
+        log.append(op)
+        self._history_size += self._cost(op)
+        # evict oldest first: undo records, then the furthest redo
+        while self._history_size > self.history_bytes and \
+                (self._undo or self._redo):
+            oldest = (self._undo or self._redo).popleft()
+            self._history_size -= self._cost(oldest)
+
+    # The edits themselves. Each returns its inverse as a
+    # (method, argument) pair.
+
+    def _append(self, string_to_add):
+        added = len(string_to_add)
+        self.length += added
+
+        # top up the last chunk, then split the rest into new chunks
+        tail = self.contents.tail
+        if tail and len(tail.value) < CHUNK:
+            room = CHUNK - len(tail.value)
+            tail.value += string_to_add[:room]
+            string_to_add = string_to_add[room:]
+
+        for start in range(0, len(string_to_add), CHUNK):
+            self.contents.add_to_tail(string_to_add[start:start + CHUNK])
+        return ('_delete_back', added)
+
+    def _prepend(self, string_to_add):
+        added = len(string_to_add)
+        self.length += added
+
+        head = self.contents.head
+        if head and len(head.value) < CHUNK:
+            room = CHUNK - len(head.value)
+            split = max(0, len(string_to_add) - room)
+            head.value = string_to_add[split:] + head.value
+            string_to_add = string_to_add[:split]
+
+        # add chunks back to front to maintain correct order
+        for end in range(len(string_to_add), 0, -CHUNK):
+            self.contents.add_to_head(string_to_add[max(0, end - CHUNK):end])
+        return ('_delete_front', added)
+
+    def _delete_front(self, chars_to_remove):
+        contents = self.contents
+        removed = []
+        while chars_to_remove > 0 and contents.head:
+            head = contents.head
+            if len(head.value) <= chars_to_remove:
+                chars_to_remove -= len(head.value)
+                self.length -= len(head.value)
+                removed.append(contents.remove_from_head())
+            else:
+                removed.append(head.value[:chars_to_remove])
+                head.value = head.value[chars_to_remove:]
+                self.length -= chars_to_remove
+                chars_to_remove = 0
+
+        # merge a trimmed head into the next chunk if they fit
+        head = contents.head
+        if head and head.next and \
+                len(head.value) + len(head.next.value) <= CHUNK:
+            head.next.value = head.value + head.next.value
+            contents.remove_from_head()
+        return ('_prepend', "".join(removed))
+
+    def _delete_back(self, chars_to_remove):
+        contents = self.contents
+        removed = []
+        while chars_to_remove > 0 and contents.tail:
+            tail = contents.tail
+            if len(tail.value) <= chars_to_remove:
+                chars_to_remove -= len(tail.value)
+                self.length -= len(tail.value)
+                removed.append(contents.remove_from_tail())
+            else:
+                removed.append(tail.value[-chars_to_remove:])
+                tail.value = tail.value[:-chars_to_remove]
+                self.length -= chars_to_remove
+                chars_to_remove = 0
+
+        tail = contents.tail
+        if tail and tail.prev and \
+                len(tail.prev.value) + len(tail.value) <= CHUNK:
+            tail.prev.value += tail.value
+            contents.remove_from_tail()
+        return ('_append', "".join(reversed(removed)))
+
+    def _join(self, other_buffer):
+        joined = other_buffer.length
+
+        # merge the two chunks meeting at the seam if they fit, then
+        # relink the rest in O(1)
+        tail, head = self.contents.tail, other_buffer.contents.head
+        if tail and len(tail.value) + len(head.value) <= CHUNK:
+            head.value = tail.value + head.value
+            self.contents.remove_from_tail()
+
+        self.contents.splice(other_buffer.contents)
+        self.length += joined
+        other_buffer.length = 0
+        return ('_delete_back', joined)
 
 
 if __name__ in "__main__":
@@ -8,6 +8,16 @@ class Node:
     self.left = None
     self.right = None
 
+# union reinserts the smaller tree's keys one by one when it is at
+# least this many levels shorter (about 1/32 the size or less)
+UNION_INSERT_GAP = 5
+
+"""
+Height of a subtree that may be missing (None)
+"""
+def _height(tree):
+  return tree.height if tree else -1
+
 """
 A tree class to keep track of things like the
 balance factor and the rebalancing logic
@@ -18,15 +28,37 @@ class AVLTree:
     # init height to -1 because of 0-indexing
     self.height = -1
     self.balance = 0
+    if node != None:
+      self.update_height(recursive=False)
+      self.update_balance()
+
+  """
+  Builds a height-balanced tree directly from sorted keys
+  in O(n), with no rotations: the middle key becomes the
+  root and each half becomes a subtree.
+  """
+  @classmethod
+  def bulk_load(cls, sorted_keys):
+    keys = list(sorted_keys)
+
+    def build(lo, hi):
+      if lo >= hi:
+        return None
+      mid = (lo + hi) // 2
+      node = Node(keys[mid])
+      node.left = build(lo, mid)
+      node.right = build(mid + 1, hi)
+      return cls(node)
+
+    return build(0, len(keys)) or cls()
 
   """
   Display the whole tree. Uses recursive def.
+  Heights and balance factors are kept up to date by
+  insert and delete, so printing doesn't recompute them.
   """
   def display(self, level=0, pref=''):
-    self.update_height()  # Update height before balancing
-    self.update_balance()
-    
-    if self.node != None: 
+    if self.node != None:
       print ('-' * level * 2, pref, self.node.key,
         f'[{self.height}:{self.balance}]',
         'L' if self.height == 0 else ' ')
@@ -37,45 +69,432 @@ class AVLTree:
 
   """
   Computes the maximum number of levels there are
-  in the tree
+  in the tree. insert and delete only need the O(1)
+  non-recursive form, since the children's heights are
+  already correct; the recursive form refreshes a whole
+  tree that was built or edited by hand.
   """
-  def update_height(self):
-    pass
+  def update_height(self, recursive=True):
+    if self.node == None:
+      self.height = -1
+      return
+
+    if recursive:
+      for child in (self.node.left, self.node.right):
+        if child != None:
+          child.update_height()
+
+    self.height = 1 + max(_height(self.node.left), _height(self.node.right))
 
   """
   Updates the balance factor on the AVLTree class
   """
   def update_balance(self):
-    pass
+    if self.node == None:
+      self.balance = 0
+    else:
+      self.balance = _height(self.node.left) - _height(self.node.right)
 
   """
   Perform a left rotation, making the right child of this
   node the parent and making the old parent the left child
-  of the new parent. 
+  of the new parent.
   """
   def left_rotate(self):
-    pass
+    old_root = self.node
+    pivot_tree = old_root.right
+    new_root = pivot_tree.node
+
+    # reuse the pivot's subtree object for the demoted node
+    old_root.right = new_root.left
+    pivot_tree.node = old_root
+    new_root.left = pivot_tree
+    self.node = new_root
+
+    pivot_tree.update_height(recursive=False)
+    pivot_tree.update_balance()
+    self.update_height(recursive=False)
+    self.update_balance()
 
   """
   Perform a right rotation, making the left child of this
   node the parent and making the old parent the right child
-  of the new parent. 
+  of the new parent.
   """
   def right_rotate(self):
-    pass
+    old_root = self.node
+    pivot_tree = old_root.left
+    new_root = pivot_tree.node
+
+    # reuse the pivot's subtree object for the demoted node
+    old_root.left = new_root.right
+    pivot_tree.node = old_root
+    new_root.right = pivot_tree
+    self.node = new_root
+
+    pivot_tree.update_height(recursive=False)
+    pivot_tree.update_balance()
+    self.update_height(recursive=False)
+    self.update_balance()
 
   """
   Sets in motion the rebalancing logic to ensure the
   tree is balanced such that the balance factor is
-  1 or -1
+  1 or -1. With refresh=True the heights of the whole
+  subtree are recomputed first; insert and delete pass
+  refresh=False because they keep heights current.
   """
-  def rebalance(self):
-    pass
-    
+  def rebalance(self, refresh=True):
+    if refresh:
+      self.update_height()
+    self.update_balance()
+
+    if self.balance > 1:
+      self.node.left.update_balance()
+      if self.node.left.balance < 0:  # left-right case
+        self.node.left.left_rotate()
+      self.right_rotate()
+    elif self.balance < -1:
+      self.node.right.update_balance()
+      if self.node.right.balance > 0:  # right-left case
+        self.node.right.right_rotate()
+      self.left_rotate()
+
   """
   Uses the same insertion logic as a binary search tree
   after the value is inserted, we need to check to see
-  if we need to rebalance
+  if we need to rebalance. Only the subtrees along the
+  insertion path update their height, O(log n) in total.
   """
   def insert(self, key):
-    pass
+    if self.node == None:
+      self.node = Node(key)
+      self.height = 0
+      self.balance = 0
+      return
+
+    if key < self.node.key:
+      if self.node.left == None:
+        self.node.left = AVLTree(Node(key))
+      else:
+        self.node.left.insert(key)
+    else:
+      if self.node.right == None:
+        self.node.right = AVLTree(Node(key))
+      else:
+        self.node.right.insert(key)
+
+    self.update_height(recursive=False)
+    self.rebalance(refresh=False)
+
+  """
+  Removes one node with the given key, rebalancing on
+  the way back up. Returns whether the key was found.
+  """
+  def delete(self, key):
+    if self.node == None:
+      return False
+
+    if key < self.node.key:
+      found = self._delete_from_child('left', key)
+    elif self.node.key < key:
+      found = self._delete_from_child('right', key)
+    else:
+      found = True
+      left, right = self.node.left, self.node.right
+      if left != None and right != None:
+        # replace the key with its in-order successor,
+        # then delete the successor from the right subtree
+        successor = right
+        while successor.node.left != None:
+          successor = successor.node.left
+        self.node.key = successor.node.key
+        self._delete_from_child('right', self.node.key)
+      else:
+        child = left if left != None else right
+        self.node = child.node if child != None else None
+
+    self.update_height(recursive=False)
+    self.rebalance(refresh=False)
+    return found
+
+  def _delete_from_child(self, side, key):
+    child = getattr(self.node, side)
+    if child == None:
+      return False
+
+    found = child.delete(key)
+    if child.node == None:  # don't keep empty subtrees around
+      setattr(self.node, side, None)
+    return found
+
+  """
+  Returns the node holding key, or None. Walks down
+  iteratively in O(log n).
+  """
+  def search(self, key):
+    tree = self
+    while tree != None and tree.node != None:
+      if key == tree.node.key:
+        return tree.node
+      tree = tree.node.left if key < tree.node.key else tree.node.right
+    return None
+
+  """
+  Concatenates this tree, key and other in O(|h1 - h2|),
+  where every key in this tree is <= key <= every key in
+  other. The result is stored in this tree and other is
+  left empty.
+  """
+  def join(self, key, other):
+    self._take(_join(_detach(self), key, _detach(other)))
+
+  """
+  Splits this tree around key in O(log n). Returns
+  (less, found, greater): trees with the keys below and
+  above key, and whether key itself was present. This
+  tree is left empty.
+  """
+  def split(self, key):
+    less, found, greater = _split(_detach(self), key)
+    return _wrap(less), found, _wrap(greater)
+
+  """
+  Merges other into this tree. Like insert, it keeps
+  duplicates: a key present in both trees ends up in the
+  result twice. Runs in O(m log(n / m + 1)) for trees of
+  sizes m <= n. When the smaller tree is much shorter, its
+  keys are inserted one by one instead, which is faster in
+  pure Python unless its keys fall between few of the
+  larger tree's. other is left empty.
+  """
+  def union(self, other):
+    first, second = _detach(self), _detach(other)
+    if first != None and second != None:
+      if first.height < second.height:
+        first, second = second, first
+      if first.height - second.height >= UNION_INSERT_GAP:
+        for key in _in_order(second):
+          first.insert(key)
+        self._take(first)
+        return
+    self._take(_union(first, second))
+
+  def _take(self, tree):
+    # make this object the root of tree (or empty), so callers'
+    # references stay valid after split/join/union
+    if tree == None:
+      self.node, self.height, self.balance = None, -1, 0
+    else:
+      self.node, self.height = tree.node, tree.height
+      self.update_balance()
+
+"""
+Helpers for join/split/union. They work on subtrees that
+are either None or non-empty AVLTrees, reuse the nodes of
+their inputs, and recurse at most O(log n) deep.
+"""
+def _detach(tree):
+  # move tree's contents into a fresh object and empty tree, so
+  # that tree can later _take a result without appearing in it
+  if tree.node == None:
+    return None
+  copy = AVLTree()
+  copy._take(tree)
+  tree._take(None)
+  return copy
+
+def _in_order(tree):
+  stack = []
+  while stack or tree != None:
+    if tree != None:
+      stack.append(tree)
+      tree = tree.node.left
+    else:
+      tree = stack.pop()
+      yield tree.node.key
+      tree = tree.node.right
+
+def _wrap(tree):
+  return tree if tree != None else AVLTree()
+
+def _make(left, key, right):
+  tree = AVLTree(Node(key))
+  tree.node.left = left
+  tree.node.right = right
+  tree.update_height(recursive=False)
+  tree.update_balance()
+  return tree
+
+def _join(left, key, right):
+  if left == None and right == None:
+    return _make(None, key, None)
+  if left == None or right == None:
+    tree = left if left != None else right
+    tree.insert(key)  # key is an extreme of tree, one O(log n) insert
+    return tree
+
+  if left.height > right.height + 1:
+    return _join_right(left, key, right)
+  if right.height > left.height + 1:
+    return _join_left(left, key, right)
+  return _make(left, key, right)
+
+def _join_right(left, key, right):
+  # walk down left's right spine to a subtree about as tall as
+  # right, hang the joined tree there and rebalance on the way up
+  child = left.node.right
+  if _height(child) <= right.height + 1:
+    left.node.right = _make(child, key, right)
+  else:
+    left.node.right = _join_right(child, key, right)
+  left.update_height(recursive=False)
+  left.rebalance(refresh=False)
+  return left
+
+def _join_left(left, key, right):
+  child = right.node.left
+  if _height(child) <= left.height + 1:
+    right.node.left = _make(left, key, child)
+  else:
+    right.node.left = _join_left(left, key, child)
+  right.update_height(recursive=False)
+  right.rebalance(refresh=False)
+  return right
+
+def _split(tree, key):
+  if tree == None:
+    return None, False, None
+
+  node = tree.node
+  if key < node.key:
+    less, found, greater = _split(node.left, key)
+    return less, found, _join(greater, node.key, node.right)
+  if node.key < key:
+    less, found, greater = _split(node.right, key)
+    return _join(node.left, node.key, less), found, greater
+  return node.left, True, node.right
+
+def _split_below(tree, key):
+  # like _split, but keys equal to key go to the second tree
+  # instead of being dropped
+  if tree == None:
+    return None, None
+
+  node = tree.node
+  if node.key < key:
+    less, rest = _split_below(node.right, key)
+    return _join(node.left, node.key, less), rest
+  less, rest = _split_below(node.left, key)
+  return less, _join(rest, node.key, node.right)
+
+def _union(first, second):
+  if first == None:
+    return second
+  if second == None:
+    return first
+
+  # split the smaller tree around the larger tree's root
+  if first.height < second.height:
+    first, second = second, first
+  node = first.node
+  less, rest = _split_below(second, node.key)
+  return _join(_union(node.left, less), node.key,
+               _union(node.right, rest))
+
+"""
+Immutable node for PersistentAVLTree. A node is never
+changed once built, so any number of versions can share it.
+"""
+class PersistentNode:
+  __slots__ = ('key', 'left', 'right', 'height')
+
+  def __init__(self, key, left=None, right=None):
+    self.key = key
+    self.left = left
+    self.right = right
+    self.height = 1 + max(_node_height(left), _node_height(right))
+
+def _node_height(node):
+  return node.height if node else -1
+
+"""
+Path-copying AVL tree. insert returns a new version and
+leaves this one untouched: only the O(log n) nodes on the
+search path are copied, every other subtree is shared with
+the previous version. Old versions stay valid, so readers
+can hold a snapshot while a writer keeps inserting, without
+locks.
+"""
+class PersistentAVLTree:
+  __slots__ = ('root', 'size')
+
+  def __init__(self, root=None, size=0):
+    self.root = root
+    self.size = size
+
+  def __len__(self):
+    return self.size
+
+  def __iter__(self):
+    stack = []
+    node = self.root
+    while stack or node:
+      if node:
+        stack.append(node)
+        node = node.left
+      else:
+        node = stack.pop()
+        yield node.key
+        node = node.right
+
+  @property
+  def height(self):
+    return _node_height(self.root)
+
+  """
+  Returns a new version with key added. Duplicate keys are
+  kept, as in AVLTree.
+  """
+  def insert(self, key):
+    return PersistentAVLTree(_insert_copy(self.root, key), self.size + 1)
+
+  """
+  Returns the node holding key, or None.
+  """
+  def search(self, key):
+    node = self.root
+    while node != None:
+      if key == node.key:
+        return node
+      node = node.left if key < node.key else node.right
+    return None
+
+def _insert_copy(node, key):
+  if node == None:
+    return PersistentNode(key)
+  if key < node.key:
+    return _balanced(node.key, _insert_copy(node.left, key), node.right)
+  return _balanced(node.key, node.left, _insert_copy(node.right, key))
+
+def _balanced(key, left, right):
+  # like rebalance, but the rotations build new nodes instead of
+  # relinking old ones, which other versions may still be using
+  balance = _node_height(left) - _node_height(right)
+  if balance > 1:
+    if _node_height(left.left) < _node_height(left.right):  # left-right case
+      pivot = left.right
+      return PersistentNode(pivot.key,
+        PersistentNode(left.key, left.left, pivot.left),
+        PersistentNode(key, pivot.right, right))
+    return PersistentNode(left.key, left.left,
+      PersistentNode(key, left.right, right))
+  if balance < -1:
+    if _node_height(right.right) < _node_height(right.left):  # right-left case
+      pivot = right.left
+      return PersistentNode(pivot.key,
+        PersistentNode(key, left, pivot.left),
+        PersistentNode(right.key, pivot.right, right.right))
+    return PersistentNode(right.key,
+      PersistentNode(key, left, right.left), right.right)
+  return PersistentNode(key, left, right)
@@ -0,0 +1,112 @@
+"""Height and throughput of AVLTree on adversarial (sorted) input,
+bulk operations against one-key-at-a-time inserts, and memory shared
+between PersistentAVLTree versions.
+
+Run with `python3 bench_avl_tree.py [n_keys ...]`.
+"""
+import math
+import random
+import sys
+import time
+import tracemalloc
+
+from avl_tree import AVLTree, PersistentAVLTree
+
+
+def run(n):
+    tree = AVLTree()
+
+    start_time = time.perf_counter()
+    for key in range(n):
+        tree.insert(key)
+    inserted = time.perf_counter() - start_time
+    height = tree.height
+
+    start_time = time.perf_counter()
+    for key in range(0, n, 7):
+        tree.search(key)
+    searched = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    for key in range(0, n, 2):
+        tree.delete(key)
+    deleted = time.perf_counter() - start_time
+
+    bound = 1.44 * math.log2(n + 2)
+    print(
+        f"{n:>9,} sorted keys  height {height:>2} "
+        f"(log2 n = {math.log2(n):4.1f}, AVL bound {bound:4.1f})  "
+        f"insert {n / inserted:9,.0f}/s  "
+        f"search {len(range(0, n, 7)) / searched:9,.0f}/s  "
+        f"delete {len(range(0, n, 2)) / deleted:9,.0f}/s"
+    )
+
+
+def timed(build):
+    start_time = time.perf_counter()
+    tree = build()
+    return tree, time.perf_counter() - start_time
+
+
+def insert_all(keys, tree=None):
+    tree = tree or AVLTree()
+    for key in keys:
+        tree.insert(key)
+    return tree
+
+
+def compare_bulk(n):
+    """bulk_load vs inserting sorted keys, and union vs reinserting a
+    small tree's keys into a large one."""
+    keys = list(range(n))
+    _, inserted = timed(lambda: insert_all(keys))
+    _, loaded = timed(lambda: AVLTree.bulk_load(keys))
+    print(f"{n:>9,} keys  insert one by one {inserted:7.3f}s  "
+          f"bulk_load {loaded:7.3f}s  ({inserted / loaded:5.1f}x)")
+
+    small = keys[1::max(1, n // 1000)]  # about 1,000 keys spread out
+    large = keys[::2]
+    big = AVLTree.bulk_load(large)
+    _, reinserted = timed(lambda: insert_all(small, big))
+    big = AVLTree.bulk_load(large)
+    other = AVLTree.bulk_load(small)
+    _, unioned = timed(lambda: big.union(other))
+    print(f"{len(small):>9,} into {len(large):,}  "
+          f"insert one by one {reinserted:7.3f}s  "
+          f"union {unioned:7.3f}s")
+
+
+def compare_persistent(n, updates=1000):
+    """Bytes and fresh nodes per insert when every version is kept,
+    against a full copy per version."""
+    tree = PersistentAVLTree()
+    for key in range(0, 2 * n, 2):
+        tree = tree.insert(key)
+
+    rng = random.Random(0)
+    keys = [rng.randrange(0, 2 * n, 2) + 1 for _ in range(updates)]
+    versions = [tree]
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    for key in keys:
+        versions.append(versions[-1].insert(key))
+    elapsed = time.perf_counter() - start_time
+    per_version = tracemalloc.get_traced_memory()[0] / updates
+    tracemalloc.stop()
+
+    node_bytes = sys.getsizeof(versions[-1].root)
+    print(f"{n:>9,} keys  {updates:,} versions kept  "
+          f"{per_version:6.0f} bytes/version "
+          f"(~{per_version / node_bytes:4.1f} nodes, height {tree.height})  "
+          f"full copy {n * node_bytes / 1024:8,.0f} KiB/version  "
+          f"insert {updates / elapsed:9,.0f}/s")
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10 ** 3, 10 ** 4, 10 ** 5]
+    for n in sizes:
+        run(n)
+    for n in sizes:
+        compare_bulk(n)
+    for n in sizes:
+        compare_persistent(n)
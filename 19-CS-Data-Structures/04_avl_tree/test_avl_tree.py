@@ -1,6 +1,8 @@
+import random
 import unittest
 from avl_tree import AVLTree
 from avl_tree import Node
+from avl_tree import PersistentAVLTree
 
 class AVLTreeTests(unittest.TestCase):
   def setUp(self):
@@ -100,5 +102,194 @@ class AVLTreeTests(unittest.TestCase):
     self.assertEqual(self.tree.node.right.node.left.node.key, 6)
     self.assertEqual(self.tree.node.right.node.right.node.key, 8) 
 
+  def assertValidAVL(self, tree, lo=None, hi=None):
+    if tree is None or tree.node is None:
+      return -1
+    key = tree.node.key
+    if lo is not None:
+      self.assertGreaterEqual(key, lo)
+    if hi is not None:
+      self.assertLessEqual(key, hi)
+    left = self.assertValidAVL(tree.node.left, lo, key)
+    right = self.assertValidAVL(tree.node.right, key, hi)
+    self.assertEqual(tree.height, 1 + max(left, right))
+    self.assertEqual(tree.balance, left - right)
+    self.assertLessEqual(abs(left - right), 1)
+    return tree.height
+
+  def keys(self, tree):
+    if tree is None or tree.node is None:
+      return []
+    return self.keys(tree.node.left) + [tree.node.key] + \
+      self.keys(tree.node.right)
+
+  def test_sorted_insertion_stays_logarithmic(self):
+    for key in range(1023):
+      self.tree.insert(key)
+    self.assertValidAVL(self.tree)
+    self.assertEqual(self.tree.height, 9)
+    self.assertEqual(self.keys(self.tree), list(range(1023)))
+
+  def test_search(self):
+    for key in (5, 3, 8, 1, 4):
+      self.tree.insert(key)
+    self.assertEqual(self.tree.search(4).key, 4)
+    self.assertEqual(self.tree.search(8).key, 8)
+    self.assertIsNone(self.tree.search(6))
+    self.assertIsNone(AVLTree().search(1))
+
+  def test_delete(self):
+    for key in range(1, 8):
+      self.tree.insert(key)
+    self.assertTrue(self.tree.delete(4))  # root, two children
+    self.assertFalse(self.tree.delete(4))
+    self.assertTrue(self.tree.delete(1))  # leaf
+    self.assertTrue(self.tree.delete(2))
+    self.assertValidAVL(self.tree)
+    self.assertEqual(self.keys(self.tree), [3, 5, 6, 7])
+    for key in (3, 5, 6, 7):
+      self.assertTrue(self.tree.delete(key))
+    self.assertIsNone(self.tree.node)
+    self.assertEqual(self.tree.height, -1)
+    self.tree.insert(9)
+    self.assertEqual(self.tree.node.key, 9)
+
+  def test_random_inserts_and_deletes(self):
+    rng = random.Random(11)
+    expected = []
+    for _ in range(1500):
+      key = rng.randint(0, 300)
+      if rng.random() < 0.6:
+        self.tree.insert(key)
+        expected.append(key)
+      else:
+        self.assertEqual(self.tree.delete(key), key in expected)
+        if key in expected:
+          expected.remove(key)
+    self.assertValidAVL(self.tree)
+    self.assertEqual(self.keys(self.tree), sorted(expected))
+
+  def test_bulk_load(self):
+    tree = AVLTree.bulk_load(range(1000))
+    self.assertValidAVL(tree)
+    self.assertEqual(tree.height, 9)
+    self.assertEqual(self.keys(tree), list(range(1000)))
+    tree.insert(1000)
+    tree.delete(0)
+    self.assertValidAVL(tree)
+
+    empty = AVLTree.bulk_load([])
+    self.assertIsNone(empty.node)
+    self.assertEqual(empty.height, -1)
+
+  def test_join(self):
+    for left_size, right_size in ((0, 0), (0, 5), (5, 0), (3, 300), (300, 3),
+                                  (100, 100)):
+      left = AVLTree.bulk_load(range(left_size))
+      right = AVLTree.bulk_load(range(left_size + 1, left_size + 1 + right_size))
+      left.join(left_size, right)
+      self.assertValidAVL(left)
+      self.assertEqual(self.keys(left), list(range(left_size + right_size + 1)))
+      self.assertIsNone(right.node)
+
+  def test_split(self):
+    tree = AVLTree.bulk_load(range(0, 200, 2))
+    less, found, greater = tree.split(100)
+    self.assertTrue(found)
+    self.assertIsNone(tree.node)
+    self.assertValidAVL(less)
+    self.assertValidAVL(greater)
+    self.assertEqual(self.keys(less), list(range(0, 100, 2)))
+    self.assertEqual(self.keys(greater), list(range(102, 200, 2)))
+
+    less, found, greater = less.split(51)
+    self.assertFalse(found)
+    self.assertEqual(self.keys(less), list(range(0, 51, 2)))
+    self.assertEqual(self.keys(greater), list(range(52, 100, 2)))
+
+    less, found, greater = AVLTree().split(1)
+    self.assertFalse(found)
+    self.assertIsNone(less.node)
+    self.assertIsNone(greater.node)
+
+  def test_union_keeps_duplicates(self):
+    rng = random.Random(4)
+    # (50, 2000), (5, 2000) and their mirrors take the insert path
+    for size_a, size_b in ((0, 10), (10, 0), (50, 2000), (2000, 50),
+                           (500, 500), (5, 2000), (2000, 5)):
+      keys_a = sorted(rng.choices(range(1000), k=size_a))
+      keys_b = sorted(rng.choices(range(1000), k=size_b))
+      tree = AVLTree.bulk_load(keys_a)
+      other = AVLTree.bulk_load(keys_b)
+      tree.union(other)
+      self.assertValidAVL(tree)
+      self.assertEqual(self.keys(tree), sorted(keys_a + keys_b))
+      self.assertIsNone(other.node)
+
+    tree = AVLTree.bulk_load([1, 2, 3])
+    tree.union(AVLTree.bulk_load([2, 3, 4]))
+    self.assertEqual(self.keys(tree), [1, 2, 2, 3, 3, 4])
+
+class PersistentAVLTreeTests(unittest.TestCase):
+  def assertValidAVL(self, node, lo=None, hi=None):
+    if node is None:
+      return -1
+    if lo is not None:
+      self.assertGreaterEqual(node.key, lo)
+    if hi is not None:
+      self.assertLessEqual(node.key, hi)
+    left = self.assertValidAVL(node.left, lo, node.key)
+    right = self.assertValidAVL(node.right, node.key, hi)
+    self.assertEqual(node.height, 1 + max(left, right))
+    self.assertLessEqual(abs(left - right), 1)
+    return node.height
+
+  def nodes(self, tree):
+    found = set()
+    stack = [tree.root]
+    while stack:
+      node = stack.pop()
+      if node is not None:
+        found.add(id(node))
+        stack.extend((node.left, node.right))
+    return found
+
+  def test_insert_returns_new_version(self):
+    empty = PersistentAVLTree()
+    one = empty.insert(5)
+    two = one.insert(3)
+    self.assertEqual(list(empty), [])
+    self.assertEqual(list(one), [5])
+    self.assertEqual(list(two), [3, 5])
+    self.assertEqual((len(empty), len(one), len(two)), (0, 1, 2))
+    self.assertIsNone(one.search(3))
+    self.assertEqual(two.search(3).key, 3)
+
+  def test_old_versions_are_unchanged(self):
+    rng = random.Random(7)
+    keys = [rng.randint(0, 1000) for _ in range(500)]
+    versions = [PersistentAVLTree()]
+    for key in keys:
+      versions.append(versions[-1].insert(key))
+    for i, version in enumerate(versions):
+      self.assertValidAVL(version.root)
+      self.assertEqual(list(version), sorted(keys[:i]))
+
+  def test_sorted_insertion_stays_logarithmic(self):
+    tree = PersistentAVLTree()
+    for key in range(1023):
+      tree = tree.insert(key)
+    self.assertValidAVL(tree.root)
+    self.assertEqual(tree.height, 9)
+
+  def test_versions_share_untouched_subtrees(self):
+    tree = PersistentAVLTree()
+    for key in range(0, 2000, 2):
+      tree = tree.insert(key)
+    newer = tree.insert(1001)
+    copied = self.nodes(newer) - self.nodes(tree)
+    # only the search path (plus at most two rotated nodes) is new
+    self.assertLessEqual(len(copied), newer.height + 3)
+
 if __name__ == '__main__':
   unittest.main()
\ No newline at end of file
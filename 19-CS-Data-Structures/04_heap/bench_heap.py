@@ -0,0 +1,194 @@
+"""Heap engines against the standard library's heapq, a sweep of
+DaryHeap arities over mixed insert/delete workloads, TopK on a
+stream, and merging sharded heaps.
+
+Run with `python3 bench_heap.py [n_elements ...]`, e.g.
+`python3 bench_heap.py 100000 1000000`.
+"""
+import heapq
+import operator
+import random
+import sys
+import time
+
+from generic_heap import Heap
+from max_heap import MaxHeap
+from dary_heap import DaryHeap
+from top_k import TopK
+from pairing_heap import PairingHeap
+
+
+class Task:
+    __slots__ = ('priority', 'name')
+
+    def __init__(self, priority, name):
+        self.priority = priority
+        self.name = name
+
+
+def timed(action):
+    start_time = time.perf_counter()
+    result = action()
+    return result, time.perf_counter() - start_time
+
+
+def heapq_run(tasks):
+    # heapq needs comparable entries, so wrap each task the usual way
+    heap = []
+    for i, task in enumerate(tasks):
+        heapq.heappush(heap, (task.priority, i, task))
+    return [heapq.heappop(heap)[2] for _ in range(len(heap))]
+
+
+def heapq_heapify_run(tasks):
+    heap = [(task.priority, i, task) for i, task in enumerate(tasks)]
+    heapq.heapify(heap)
+    return [heapq.heappop(heap)[2] for _ in range(len(heap))]
+
+
+def heap_run(make):
+    def run(tasks):
+        heap = make()
+        for task in tasks:
+            heap.insert(task)
+        return heap.pop_many(len(tasks))
+    return run
+
+
+def heap_heapify_run(**options):
+    def run(tasks):
+        return Heap.heapify(tasks, **options).pop_many(len(tasks))
+    return run
+
+
+def compare(n):
+    """Push n tasks and pop them all in priority order (min first)."""
+    rng = random.Random(0)
+    tasks = [Task(rng.random(), i) for i in range(n)]
+    expected = sorted(task.priority for task in tasks)
+
+    by_priority = lambda a, b: a.priority < b.priority
+    engines = {
+        'heapq, push/pop': heapq_run,
+        'heapq, heapify/pop': heapq_heapify_run,
+        'Heap comparator, insert': heap_run(lambda: Heap(by_priority)),
+        'Heap key=, insert': heap_run(
+            lambda: Heap(operator.lt, key=operator.attrgetter('priority'))),
+        'Heap comparator, heapify': heap_heapify_run(comparator=by_priority),
+        'Heap key=, heapify': heap_heapify_run(
+            comparator=operator.lt, key=operator.attrgetter('priority')),
+    }
+    for label, run in engines.items():
+        popped, elapsed = timed(lambda: run(tasks))
+        assert [task.priority for task in popped] == expected
+        print(f"{label:<28} {n:>9,} tasks  {elapsed:7.2f}s  "
+              f"{n / elapsed:11,.0f} tasks/s")
+
+
+def workload(n, inserts_per_delete, seed=0):
+    """n operations: 'i' inserts a random value, 'd' deletes the max."""
+    rng = random.Random(seed)
+    insert_share = inserts_per_delete / (inserts_per_delete + 1)
+    return [('i', rng.random()) if rng.random() < insert_share else ('d', 0)
+            for _ in range(n)]
+
+
+def replay(heap, ops):
+    insert, delete = heap.insert, heap.delete
+    for op, value in ops:
+        if op == 'i':
+            insert(value)
+        else:
+            delete()
+
+
+def sweep_arity(n, arities=(2, 3, 4, 8, 16)):
+    """Time each arity on a prefilled heap under insert-heavy, balanced
+    and delete-heavy mixes."""
+    rng = random.Random(1)
+    prefill = [rng.random() for _ in range(n // 2)]
+    mixes = {'insert-heavy 9:1': 9, 'balanced 1:1': 1, 'delete-heavy 1:3': 1 / 3}
+    for label, ratio in mixes.items():
+        ops = workload(n, ratio)
+        row = []
+        for d in arities:
+            heap = DaryHeap(d)
+            for value in prefill:
+                heap.insert(value)
+            _, elapsed = timed(lambda: replay(heap, ops))
+            row.append(f"d={d} {n / elapsed / 1e3:6.0f}k/s")
+        baseline = MaxHeap()
+        for value in prefill:
+            baseline.insert(value)
+        _, elapsed = timed(lambda: replay(baseline, ops))
+        print(f"{label:<18} {n:>9,} ops  MaxHeap {n / elapsed / 1e3:6.0f}k/s  "
+              + "  ".join(row))
+
+
+def top_k_stream(n, k=100):
+    """Largest k of n random values, one at a time and as a list."""
+    rng = random.Random(2)
+    values = [rng.random() for _ in range(n)]
+    expected = heapq.nlargest(k, values)
+
+    def one_at_a_time():
+        top = TopK(k)
+        for value in values:
+            top.push(value)
+        return top.result()
+
+    def all_at_once():
+        top = TopK(k)
+        top.push_many(values)
+        return top.result()
+
+    runs = {
+        'heapq.nlargest': lambda: heapq.nlargest(k, values),
+        'TopK.push': one_at_a_time,
+        'TopK.push_many, list': all_at_once,
+    }
+
+    for label, run in runs.items():
+        result, elapsed = timed(run)
+        assert result == expected
+        print(f"{label:<36} {n:>11,} values  k={k}  "
+              f"{n / elapsed / 1e6:7.2f}M values/s")
+
+
+def merge_shards(n, shards=8):
+    """Fill one heap per shard, merge them all into the first, then
+    drain it: MaxHeap re-inserts, PairingHeap melds."""
+    rng = random.Random(3)
+    values = [rng.random() for _ in range(n)]
+    expected = sorted(values, reverse=True)
+
+    for engine in (MaxHeap, PairingHeap):
+        heaps = [engine() for _ in range(shards)]
+        _, filled = timed(lambda: [heaps[i % shards].insert(value)
+                                   for i, value in enumerate(values)])
+
+        def merge():
+            merged = heaps[0]
+            for other in heaps[1:]:
+                if engine is PairingHeap:
+                    merged.meld(other)
+                else:
+                    while other.get_size():
+                        merged.insert(other.delete())
+            return merged
+        merged, merging = timed(merge)
+        drained, draining = timed(
+            lambda: [merged.delete() for _ in range(merged.get_size())])
+        assert drained == expected
+        print(f"{engine.__name__:<12} {n:>9,} values in {shards} shards  "
+              f"insert {filled:6.2f}s  merge {merging * 1e3:9.3f} ms  "
+              f"drain {draining:6.2f}s")
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10 ** 6]
+    for n in sizes:
+        compare(n)
+        sweep_arity(n)
+        top_k_stream(10 * n)
+        merge_shards(n)
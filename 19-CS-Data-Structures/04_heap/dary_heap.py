@@ -0,0 +1,45 @@
+from max_heap import MaxHeap
+
+
+class DaryHeap(MaxHeap):
+    """MaxHeap where every node has up to d children instead of two.
+
+    The children of index i are d * i + 1 ... d * i + d, so the tree is
+    log_d(n) levels deep: inserts, which only compare against parents,
+    get cheaper as d grows, while each level of a delete compares up to
+    d children. d=2 behaves exactly like MaxHeap.
+    """
+    def __init__(self, d=4):
+        if d < 2:
+            raise ValueError('a heap needs at least two children per node')
+        super().__init__()
+        self.d = d
+
+    def _bubble_up(self, index):
+        storage, d = self.storage, self.d
+        while index > 0:
+            parent_i = (index - 1) // d
+            if storage[parent_i] < storage[index]:
+                self._swap(index, parent_i)
+                index = parent_i
+            else:
+                break
+
+    def _sift_down(self, index):
+        storage, d = self.storage, self.d
+        size = len(storage)
+        first_i = d * index + 1
+
+        while first_i < size:
+            # largest of the up to d children
+            swap_i, largest = first_i, storage[first_i]
+            for child_i in range(first_i + 1, min(first_i + d, size)):
+                if largest < storage[child_i]:
+                    swap_i, largest = child_i, storage[child_i]
+
+            if storage[index] < storage[swap_i]:
+                self._swap(index, swap_i)
+                index = swap_i
+                first_i = d * index + 1
+            else:
+                break
@@ -1,22 +1,165 @@
+import operator
+
+
 class Heap:
-    def __init__(self, comparator):
+    """Binary heap ordered by comparator(a, b), which returns True when
+    a belongs above b. The default, operator.gt, makes a max heap;
+    `lambda x, y: x < y` makes a min heap.
+
+    With key=, each value's sort key is computed once when it's added
+    and kept in a list parallel to storage, and the comparator is
+    applied to keys. Passing e.g. key=attrgetter('priority') instead of
+    a comparator that looks the attribute up again on every sift step
+    leaves the inner loops with a single built-in comparison.
+    """
+    def __init__(self, comparator=None, key=None):
         self.storage = []
-        self.comparator = comparator
+        self.comparator = comparator or operator.gt
+        self.key = key
+        self._keys = [] if key else None
+
+    @classmethod
+    def heapify(cls, values, comparator=None, key=None):
+        """Build a heap from values in O(n), sifting down from the last
+        parent instead of inserting one value at a time."""
+        heap = cls(comparator, key)
+        heap.storage = list(values)
+        if key:
+            heap._keys = [key(value) for value in heap.storage]
+        heap._heapify()
+        return heap
+
+    def _heapify(self):
+        for index in reversed(range(len(self.storage) // 2)):
+            self._sift_down(index)
 
     def insert(self, value):
-        pass
+        self.storage.append(value)
+        if self._keys is not None:
+            self._keys.append(self.key(value))
+        self._bubble_up(len(self.storage) - 1)
+
+    def insert_many(self, values):
+        """Add every value. When the batch is at least as large as the
+        heap, appending all of it and re-heapifying (O(n + k)) beats
+        k separate inserts (O(k log n))."""
+        values = list(values)
+        if len(values) < len(self.storage):
+            for value in values:
+                self.insert(value)
+            return
+
+        self.storage.extend(values)
+        if self._keys is not None:
+            self._keys.extend(map(self.key, values))
+        self._heapify()
 
     def delete(self):
-        pass
+        if not self.storage:
+            return None
+
+        last = self.storage.pop()
+        if self._keys is not None:
+            last_key = self._keys.pop()
+        if not self.storage:
+            return last
+
+        top = self.storage[0]  # store top heap value so we can return it
+        self.storage[0] = last
+        if self._keys is not None:
+            self._keys[0] = last_key
+        self._sift_down(0)
+        return top
+
+    def pushpop(self, value):
+        """Insert value, then delete and return the highest priority
+        value, in one sift. Returns value itself without touching the
+        heap when nothing in the heap outranks it."""
+        storage, keys = self.storage, self._keys
+        if not storage:
+            return value
+        priority = value if keys is None else self.key(value)
+        top_priority = storage[0] if keys is None else keys[0]
+        if not self.comparator(top_priority, priority):
+            return value
+
+        top = storage[0]
+        storage[0] = value
+        if keys is not None:
+            keys[0] = priority
+        self._sift_down(0)
+        return top
+
+    def pop_many(self, k):
+        """Delete and return up to k values, highest priority first."""
+        return [self.delete() for _ in range(min(k, len(self.storage)))]
 
     def get_priority(self):
-        pass
+        if self.storage:
+            return self.storage[0]
+        else:
+            return None
 
     def get_size(self):
-        pass
+        return len(self.storage)
+
+    def get_top_priority(self):
+        """What the top value is ranked by: key(top) with key=, else
+        the top value itself. None when the heap is empty."""
+        if not self.storage:
+            return None
+        return self.storage[0] if self._keys is None else self._keys[0]
+
+    def get_priorities(self):
+        """A list of what each value is ranked by, parallel to
+        storage."""
+        return list(self.storage if self._keys is None else self._keys)
+
+    # Both sifts move a "hole" instead of swapping at every level: the
+    # moving value is written once, at its final position.
 
     def _bubble_up(self, index):
-        pass
+        storage, keys = self.storage, self._keys
+        priorities = storage if keys is None else keys
+        higher = self.comparator
+
+        value, priority = storage[index], priorities[index]
+        while index > 0:
+            parent_i = (index - 1) // 2
+            if not higher(priority, priorities[parent_i]):
+                break
+            storage[index] = storage[parent_i]
+            if keys is not None:
+                keys[index] = keys[parent_i]
+            index = parent_i
+
+        storage[index] = value
+        if keys is not None:
+            keys[index] = priority
 
     def _sift_down(self, index):
-        pass
+        storage, keys = self.storage, self._keys
+        priorities = storage if keys is None else keys
+        higher = self.comparator
+        end_i = len(storage) - 1
+
+        value, priority = storage[index], priorities[index]
+        l_i = 2 * index + 1
+        while l_i <= end_i:
+            r_i = l_i + 1
+            if r_i <= end_i and higher(priorities[r_i], priorities[l_i]):
+                swap_i = r_i
+            else:
+                swap_i = l_i
+
+            if not higher(priorities[swap_i], priority):
+                break
+            storage[index] = storage[swap_i]
+            if keys is not None:
+                keys[index] = keys[swap_i]
+            index = swap_i
+            l_i = 2 * index + 1
+
+        storage[index] = value
+        if keys is not None:
+            keys[index] = priority
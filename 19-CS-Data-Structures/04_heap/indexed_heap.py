@@ -0,0 +1,94 @@
+from max_heap import MaxHeap
+
+
+class _Entry:
+    __slots__ = ('priority', 'item')
+
+    def __init__(self, priority, item):
+        self.priority = priority
+        self.item = item
+
+    def __lt__(self, other):
+        # order by priority only, so items never need to be comparable
+        return self.priority < other.priority
+
+
+class IndexedMaxHeap(MaxHeap):
+    """MaxHeap of (item, priority) pairs that also maps each item to its
+    index in storage, kept current by every swap in the sifts.
+
+    That makes contains O(1) and update_priority and remove O(log n),
+    instead of a linear scan to find the item. Items must be hashable
+    and unique. For a min-priority queue (e.g. Dijkstra), negate the
+    priorities.
+    """
+    def __init__(self):
+        super().__init__()
+        self.position = {}  # item -> index in storage
+
+    def __len__(self):
+        return len(self.storage)
+
+    def __contains__(self, item):
+        return item in self.position
+
+    def contains(self, item):
+        return item in self.position
+
+    def insert(self, item, priority):
+        if item in self.position:
+            raise ValueError(f'{item!r} is already in the heap')
+        self.position[item] = len(self.storage)
+        self.storage.append(_Entry(priority, item))
+        self._bubble_up(len(self.storage) - 1)
+
+    def delete(self):
+        """Remove and return the (item, priority) pair with the highest
+        priority, or None if the heap is empty."""
+        if not self.storage:
+            return None
+        top = self.storage[0]
+        self.remove(top.item)
+        return top.item, top.priority
+
+    def get_max(self):
+        if self.storage:
+            top = self.storage[0]
+            return top.item, top.priority
+        else:
+            return None
+
+    def priority(self, item):
+        return self.storage[self.position[item]].priority
+
+    def update_priority(self, item, priority):
+        """Change item's priority in place and restore the heap order
+        by moving it up or down. Raises KeyError if item is missing."""
+        index = self.position[item]
+        entry = self.storage[index]
+        old_priority, entry.priority = entry.priority, priority
+        if old_priority < priority:
+            self._bubble_up(index)
+        else:
+            self._sift_down(index)
+
+    def remove(self, item):
+        """Remove item wherever it is in the heap and return its
+        priority. Raises KeyError if item is missing."""
+        index = self.position.pop(item)
+        removed = self.storage[index]
+        last = self.storage.pop()
+        if index < len(self.storage):
+            # fill the hole with the last entry, then move it whichever
+            # way it needs to go
+            self.storage[index] = last
+            self.position[last.item] = index
+            self._bubble_up(index)
+            self._sift_down(self.position[last.item])
+        return removed.priority
+
+    def _swap(self, i, j):
+        storage = self.storage
+        storage[i], storage[j] = storage[j], storage[i]
+        self.position[storage[i].item] = i
+        self.position[storage[j].item] = j
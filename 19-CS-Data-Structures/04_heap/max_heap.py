@@ -35,8 +35,7 @@ class MaxHeap:
                 break
 
             if self.storage[parent_i] < self.storage[index]:
-                self.storage[index], self.storage[parent_i] = \
-                    self.storage[parent_i], self.storage[index]  # swap
+                self._swap(index, parent_i)
 
                 index = parent_i
             else:
@@ -55,10 +54,14 @@ class MaxHeap:
                 swap_i = l_i
 
             if self.storage[index] < self.storage[swap_i]:
-                self.storage[index], self.storage[swap_i] = \
-                    self.storage[swap_i], self.storage[index]  # swap
+                self._swap(index, swap_i)
 
                 index = swap_i
                 l_i = 2 * index + 1
             else:
                 break
+
+    def _swap(self, i, j):
+        # every move in the sifts goes through here, so subclasses can
+        # track where each element is
+        self.storage[i], self.storage[j] = self.storage[j], self.storage[i]
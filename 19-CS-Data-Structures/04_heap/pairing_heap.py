@@ -0,0 +1,85 @@
+class PairingNode:
+    __slots__ = ('value', 'child', 'sibling')
+
+    def __init__(self, value):
+        self.value = value
+        self.child = None  # first (leftmost) child
+        self.sibling = None  # next child of the same parent
+
+
+def _link(a, b):
+    # the smaller root becomes the first child of the larger
+    if a.value < b.value:
+        a, b = b, a
+    b.sibling = a.child
+    a.child = b
+    return a
+
+
+def _merge_pairs(first):
+    """Two-pass merge of a sibling list into one tree: link neighbours
+    pairwise left to right, then fold the pairs right to left."""
+    pairs = []
+    while first:
+        second = first.sibling
+        if not second:
+            first.sibling = None
+            pairs.append(first)
+            break
+        rest = second.sibling
+        first.sibling = second.sibling = None
+        pairs.append(_link(first, second))
+        first = rest
+
+    root = pairs.pop() if pairs else None
+    while pairs:
+        root = _link(pairs.pop(), root)
+    return root
+
+
+class PairingHeap:
+    """Max heap as a multiway tree, with the same insert/delete/get_max/
+    get_size API as MaxHeap plus meld.
+
+    insert and meld only link two roots, O(1); delete re-merges the
+    root's children in two passes, amortized O(log n). Merging two
+    MaxHeaps means re-inserting every element, while meld takes over
+    the other heap's whole tree at once.
+    """
+    def __init__(self):
+        self.root = None
+        self.size = 0
+
+    def insert(self, value):
+        node = PairingNode(value)
+        self.root = _link(self.root, node) if self.root else node
+        self.size += 1
+
+    def meld(self, other):
+        """Move every value of other into this heap in O(1), leaving
+        other empty."""
+        if other is self:
+            raise ValueError('cannot meld a heap with itself')
+        if other.root:
+            self.root = _link(self.root, other.root) if self.root \
+                else other.root
+            self.size += other.size
+        other.root = None
+        other.size = 0
+
+    def delete(self):
+        if not self.root:
+            return None
+        top = self.root.value
+        self.root = _merge_pairs(self.root.child)
+        self.size -= 1
+        return top
+
+    def get_max(self):
+        if self.root:
+            return self.root.value
+        else:
+            return None
+
+    def get_size(self):
+        return self.size
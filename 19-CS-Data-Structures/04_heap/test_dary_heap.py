@@ -0,0 +1,76 @@
+import random
+import unittest
+from unittest.mock import MagicMock
+from dary_heap import DaryHeap
+from max_heap import MaxHeap
+
+class DaryHeapTests(unittest.TestCase):
+  def setUp(self):
+    self.heap = DaryHeap(4)
+
+  def assertHeapOrdered(self):
+    storage, d = self.heap.storage, self.heap.d
+    for index in range(1, len(storage)):
+      self.assertGreaterEqual(storage[(index - 1) // d], storage[index])
+
+  def test_heap_insert_works(self):
+    for value in [6, 8, 10, 9, 1, 9, 9, 5]:
+      self.heap.insert(value)
+    self.assertEqual(self.heap.storage, [10, 9, 8, 9, 1, 6, 9, 5])
+    self.assertEqual(self.heap.get_size(), 8)
+    self.assertEqual(self.heap.get_max(), 10)
+
+  def test_delete_elements_in_order(self):
+    for value in [6, 7, 5, 8, 10, 1, 2, 5]:
+      self.heap.insert(value)
+
+    descending_order = []
+
+    while self.heap.get_size() > 0:
+      descending_order.append(self.heap.delete())
+
+    self.assertEqual(descending_order, [10, 8, 7, 6, 5, 5, 2, 1])
+    self.assertIsNone(self.heap.delete())
+    self.assertIsNone(self.heap.get_max())
+
+  def test_binary_arity_matches_max_heap(self):
+    self.heap = DaryHeap(2)
+    max_heap = MaxHeap()
+    rng = random.Random(1)
+    for _ in range(500):
+      value = rng.randrange(100)
+      self.heap.insert(value)
+      max_heap.insert(value)
+      if rng.random() < 0.3:
+        self.assertEqual(self.heap.delete(), max_heap.delete())
+    self.assertEqual(self.heap.storage, max_heap.storage)
+
+  def test_random_operations_for_several_arities(self):
+    for d in (2, 3, 5, 8, 16):
+      self.heap = DaryHeap(d)
+      rng = random.Random(d)
+      expected = []
+      for _ in range(1000):
+        if rng.random() < 0.6:
+          value = rng.randrange(1000)
+          self.heap.insert(value)
+          expected.append(value)
+        elif expected:
+          expected.remove(max(expected))
+          self.heap.delete()
+        self.assertHeapOrdered()
+      self.assertEqual([self.heap.delete() for _ in expected],
+                       sorted(expected, reverse=True))
+
+  def test_invalid_arity(self):
+    self.assertRaises(ValueError, DaryHeap, 1)
+
+  def test_sift_down_was_called(self):
+    self.heap._sift_down = MagicMock()
+    self.heap.insert(10)
+    self.heap.insert(11)
+    self.heap.delete()
+    self.assertTrue(self.heap._sift_down.called)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -1,4 +1,6 @@
+import random
 import unittest
+from operator import itemgetter
 from unittest.mock import MagicMock
 from generic_heap import Heap
 
@@ -146,5 +148,87 @@ class HeapTests(unittest.TestCase):
     self.heap.delete()
     self.assertTrue(self.heap._sift_down.called)
 
+  def test_heapify(self):
+    values = [6, 8, 10, 9, 1, 9, 9, 5]
+    self.heap = Heap.heapify(values)
+    self.assertEqual(self.heap.get_size(), 8)
+    self.assertEqual(self.heap.pop_many(8), sorted(values, reverse=True))
+
+    self.heap = Heap.heapify(values, lambda x, y: x < y)
+    self.assertEqual(self.heap.pop_many(8), sorted(values))
+    self.assertEqual(Heap.heapify([]).get_priority(), None)
+
+  def test_key_mode(self):
+    tasks = [('write', 3), ('test', 5), ('ship', 1), ('review', 4)]
+    self.heap = Heap(key=itemgetter(1))
+    for task in tasks:
+      self.heap.insert(task)
+    self.assertEqual(self.heap.get_priority(), ('test', 5))
+    self.assertEqual([name for name, _ in self.heap.pop_many(4)],
+                     ['test', 'review', 'write', 'ship'])
+
+    self.heap = Heap.heapify(tasks, lambda x, y: x < y, key=itemgetter(1))
+    self.assertEqual(self.heap.delete(), ('ship', 1))
+    self.assertEqual(self.heap._keys, [priority for _, priority in self.heap.storage])
+
+  def test_key_is_computed_once_per_value(self):
+    key = MagicMock(side_effect=lambda x: -x)
+    self.heap = Heap(key=key)
+    for value in range(100):
+      self.heap.insert(value)
+    self.heap.pop_many(50)
+    self.assertEqual(key.call_count, 100)
+
+  def test_insert_many_and_pop_many(self):
+    rng = random.Random(2)
+    values = [rng.randint(0, 1000) for _ in range(500)]
+    self.heap.insert_many(values[:10])  # batch larger than the heap
+    self.heap.insert_many(values[10:12])  # smaller: one insert each
+    self.heap.insert_many(values[12:])
+    self.assertEqual(self.heap.get_size(), 500)
+    self.assertEqual(self.heap.pop_many(100), sorted(values, reverse=True)[:100])
+    self.assertEqual(len(self.heap.pop_many(1000)), 400)
+    self.assertEqual(self.heap.pop_many(3), [])
+
+  def test_pushpop_on_empty_heap(self):
+    self.assertEqual(self.heap.pushpop(4), 4)
+    self.assertEqual(self.heap.get_size(), 0)
+
+  def test_pushpop_value_that_does_not_beat_the_root(self):
+    self.heap = Heap(lambda x, y: x < y)
+    self.heap.insert_many([5, 3, 8])
+    storage = list(self.heap.storage)
+    self.assertEqual(self.heap.pushpop(1), 1)  # outranks the whole heap
+    self.assertEqual(self.heap.pushpop(3), 3)  # ties don't replace the root
+    self.assertEqual(self.heap.storage, storage)
+
+  def test_pushpop_replaces_the_root(self):
+    self.heap = Heap(lambda x, y: x < y)
+    self.heap.insert_many([5, 3, 8])
+    self.assertEqual(self.heap.pushpop(6), 3)
+    self.assertEqual(self.heap.pop_many(3), [5, 6, 8])
+
+  def test_pushpop_with_key(self):
+    self.heap = Heap(key=itemgetter(0))
+    self.heap.insert_many([(2, 'b'), (1, 'a')])
+    self.assertEqual(self.heap.pushpop((3, 'c')), (3, 'c'))
+    self.assertEqual(self.heap.get_priorities(), [2, 1])
+    self.assertEqual(self.heap.pushpop((0, 'z')), (2, 'b'))
+    self.assertEqual(self.heap.get_priorities(), [1, 0])
+    self.assertEqual(self.heap.pop_many(2), [(1, 'a'), (0, 'z')])
+
+  def test_priority_accessors(self):
+    self.assertIsNone(self.heap.get_top_priority())
+    self.assertEqual(self.heap.get_priorities(), [])
+    self.heap.insert_many([3, 9, 4])
+    self.assertEqual(self.heap.get_top_priority(), 9)
+    self.assertEqual(sorted(self.heap.get_priorities()), [3, 4, 9])
+
+    self.heap = Heap(key=itemgetter(1))
+    self.heap.insert_many([('a', 3), ('b', 10)])
+    self.assertEqual(self.heap.get_top_priority(), 10)
+    self.assertEqual(self.heap.get_priorities(),
+                     [key for _, key in self.heap.storage])
+
 if __name__ == '__main__':
   unittest.main()
\ No newline at end of file
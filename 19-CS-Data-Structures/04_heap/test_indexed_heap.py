@@ -0,0 +1,102 @@
+import random
+import unittest
+from indexed_heap import IndexedMaxHeap
+
+class IndexedMaxHeapTests(unittest.TestCase):
+  def setUp(self):
+    self.heap = IndexedMaxHeap()
+
+  def assertPositions(self):
+    self.assertEqual(len(self.heap.position), self.heap.get_size())
+    for item, index in self.heap.position.items():
+      self.assertEqual(self.heap.storage[index].item, item)
+    for index in range(1, self.heap.get_size()):
+      parent = self.heap.storage[(index - 1) // 2]
+      self.assertGreaterEqual(parent.priority, self.heap.storage[index].priority)
+
+  def test_insert_and_delete_in_priority_order(self):
+    for item, priority in (('a', 6), ('b', 8), ('c', 10), ('d', 1), ('e', 9)):
+      self.heap.insert(item, priority)
+    self.assertEqual(self.heap.get_max(), ('c', 10))
+    self.assertTrue(self.heap.contains('d'))
+    self.assertIn('e', self.heap)
+    self.assertPositions()
+
+    order = []
+    while self.heap.get_size() > 0:
+      order.append(self.heap.delete())
+    self.assertEqual(order, [('c', 10), ('e', 9), ('b', 8), ('a', 6), ('d', 1)])
+    self.assertIsNone(self.heap.delete())
+    self.assertIsNone(self.heap.get_max())
+    self.assertFalse(self.heap.contains('a'))
+
+  def test_duplicate_items_are_rejected(self):
+    self.heap.insert('a', 1)
+    self.assertRaises(ValueError, self.heap.insert, 'a', 2)
+
+  def test_update_priority(self):
+    for item, priority in enumerate([5, 3, 8, 1, 7]):
+      self.heap.insert(item, priority)
+    self.heap.update_priority(3, 100)  # up
+    self.assertEqual(self.heap.get_max(), (3, 100))
+    self.heap.update_priority(3, 0)  # down
+    self.assertEqual(self.heap.get_max(), (2, 8))
+    self.assertEqual(self.heap.priority(3), 0)
+    self.assertPositions()
+    self.assertRaises(KeyError, self.heap.update_priority, 'missing', 1)
+
+  def test_remove(self):
+    for item in range(20):
+      self.heap.insert(item, (item * 7) % 20)
+    self.assertEqual(self.heap.remove(5), 15)
+    self.assertEqual(self.heap.remove(19), 13)
+    self.assertFalse(self.heap.contains(5))
+    self.assertEqual(self.heap.get_size(), 18)
+    self.assertPositions()
+    self.assertRaises(KeyError, self.heap.remove, 5)
+
+  def test_random_operations_keep_positions(self):
+    rng = random.Random(9)
+    expected = {}
+    for _ in range(3000):
+      item = rng.randrange(200)
+      action = rng.random()
+      if item not in expected:
+        priority = rng.randrange(1000)
+        self.heap.insert(item, priority)
+        expected[item] = priority
+      elif action < 0.5:
+        priority = rng.randrange(1000)
+        self.heap.update_priority(item, priority)
+        expected[item] = priority
+      else:
+        self.assertEqual(self.heap.remove(item), expected.pop(item))
+    self.assertPositions()
+    order = [self.heap.delete()[1] for _ in range(self.heap.get_size())]
+    self.assertEqual(order, sorted(expected.values(), reverse=True))
+
+  def test_dijkstra(self):
+    graph = {
+      'a': {'b': 7, 'c': 9, 'f': 14},
+      'b': {'a': 7, 'c': 10, 'd': 15},
+      'c': {'a': 9, 'b': 10, 'd': 11, 'f': 2},
+      'd': {'b': 15, 'c': 11, 'e': 6},
+      'e': {'d': 6, 'f': 9},
+      'f': {'a': 14, 'c': 2, 'e': 9},
+    }
+    distance = {'a': 0}
+    self.heap.insert('a', 0)  # priorities are negated distances
+    while self.heap.get_size() > 0:
+      node, priority = self.heap.delete()
+      for neighbour, weight in graph[node].items():
+        candidate = -priority + weight
+        if neighbour not in distance:
+          distance[neighbour] = candidate
+          self.heap.insert(neighbour, -candidate)
+        elif candidate < distance[neighbour] and neighbour in self.heap:
+          distance[neighbour] = candidate
+          self.heap.update_priority(neighbour, -candidate)  # decrease-key
+    self.assertEqual(distance, {'a': 0, 'b': 7, 'c': 9, 'd': 20, 'e': 20, 'f': 11})
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,86 @@
+import random
+import unittest
+from pairing_heap import PairingHeap
+
+class PairingHeapTests(unittest.TestCase):
+  def setUp(self):
+    self.heap = PairingHeap()
+
+  def test_get_max_works(self):
+    for value in [6, 8, 10, 9, 1, 9, 9, 5]:
+      self.heap.insert(value)
+    self.assertEqual(self.heap.get_size(), 8)
+    self.assertEqual(self.heap.get_max(), 10)
+
+  def test_get_max_after_delete(self):
+    for value in [6, 8, 10, 9, 1, 9, 9, 5]:
+      self.heap.insert(value)
+    self.heap.delete()
+    self.assertEqual(self.heap.get_max(), 9)
+    self.heap.delete()
+    self.assertEqual(self.heap.get_max(), 9)
+    self.heap.delete()
+    self.assertEqual(self.heap.get_max(), 9)
+    self.heap.delete()
+    self.assertEqual(self.heap.get_max(), 8)
+    self.heap.delete()
+    self.assertEqual(self.heap.get_max(), 6)
+
+  def test_delete_elements_in_order(self):
+    for value in [6, 7, 5, 8, 10, 1, 2, 5]:
+      self.heap.insert(value)
+
+    descending_order = []
+
+    while self.heap.get_size() > 0:
+      descending_order.append(self.heap.delete())
+
+    self.assertEqual(descending_order, [10, 8, 7, 6, 5, 5, 2, 1])
+    self.assertIsNone(self.heap.delete())
+    self.assertIsNone(self.heap.get_max())
+
+  def test_meld(self):
+    other = PairingHeap()
+    for value in [3, 12, 7]:
+      other.insert(value)
+    for value in [5, 1, 9]:
+      self.heap.insert(value)
+    self.heap.meld(other)
+    self.assertEqual(self.heap.get_size(), 6)
+    self.assertEqual(other.get_size(), 0)
+    self.assertIsNone(other.get_max())
+    self.assertEqual([self.heap.delete() for _ in range(6)], [12, 9, 7, 5, 3, 1])
+
+    self.heap.meld(PairingHeap())
+    self.assertEqual(self.heap.get_size(), 0)
+    other.insert(4)
+    self.heap.meld(other)
+    self.assertEqual(self.heap.get_max(), 4)
+    self.assertRaises(ValueError, self.heap.meld, self.heap)
+
+  def test_random_shards_meld_in_order(self):
+    rng = random.Random(12)
+    expected = []
+    for _ in range(20):
+      shard = PairingHeap()
+      for _ in range(rng.randrange(200)):
+        value = rng.randrange(10000)
+        shard.insert(value)
+        expected.append(value)
+      for _ in range(rng.randrange(10)):
+        value = shard.delete()
+        if value is not None:
+          expected.remove(value)
+      self.heap.meld(shard)
+    self.assertEqual(self.heap.get_size(), len(expected))
+    self.assertEqual([self.heap.delete() for _ in expected],
+                     sorted(expected, reverse=True))
+
+  def test_long_sibling_lists_do_not_recurse(self):
+    for value in reversed(range(100000)):  # all children of the root
+      self.heap.insert(value)
+    self.assertEqual(self.heap.delete(), 99999)
+    self.assertEqual(self.heap.delete(), 99998)
+
+if __name__ == '__main__':
+  unittest.main()
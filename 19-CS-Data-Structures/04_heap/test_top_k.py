@@ -0,0 +1,40 @@
+import random
+import unittest
+from operator import itemgetter
+from top_k import TopK
+
+class TopKTests(unittest.TestCase):
+  def setUp(self):
+    self.top = TopK(3)
+
+  def test_keeps_k_largest(self):
+    for value in [5, 1, 9, 3, 7, 9, 2, 8]:
+      self.top.push(value)
+    self.assertEqual(len(self.top), 3)
+    self.assertEqual(self.top.threshold, 8)
+    self.assertEqual(self.top.result(), [9, 9, 8])
+
+  def test_fewer_items_than_k(self):
+    self.top.push(4)
+    self.assertIsNone(self.top.threshold)
+    self.assertEqual(self.top.result(), [4])
+    self.assertEqual(TopK(5).result(), [])
+
+  def test_invalid_k(self):
+    self.assertRaises(ValueError, TopK, 0)
+
+  def test_key(self):
+    self.top = TopK(2, key=itemgetter(1))
+    self.top.push_many([('a', 3), ('b', 10), ('c', 1), ('d', 7)])
+    self.assertEqual(self.top.threshold, 7)
+    self.assertEqual(self.top.result(), [('b', 10), ('d', 7)])
+
+  def test_push_many_matches_sorted(self):
+    rng = random.Random(6)
+    values = [rng.random() for _ in range(10000)]
+    self.top = TopK(50)
+    self.top.push_many(values)
+    self.assertEqual(self.top.result(), sorted(values, reverse=True)[:50])
+
+if __name__ == '__main__':
+  unittest.main()
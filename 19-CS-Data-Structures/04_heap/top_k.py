@@ -0,0 +1,62 @@
+import operator
+
+from generic_heap import Heap
+
+
+class TopK:
+    """Keeps the k largest items seen in a stream, in O(k) memory.
+
+    The items live in a min-heap of size k, so its root is the
+    threshold: the smallest item still in the top k. A new item below
+    the threshold is dropped after one comparison; otherwise it
+    replaces the root with a single pushpop. With key=, items are
+    ranked by key(item), computed once per item kept.
+    """
+    def __init__(self, k, key=None):
+        if k < 1:
+            raise ValueError('k must be at least 1')
+        self.k = k
+        self.key = key
+        self.heap = Heap(operator.lt, key=key)
+
+    def __len__(self):
+        return self.heap.get_size()
+
+    @property
+    def threshold(self):
+        """Rank (key) an item must beat to enter a full TopK, or None
+        while fewer than k items have been seen."""
+        if self.heap.get_size() < self.k:
+            return None
+        return self.heap.get_top_priority()
+
+    def push(self, item):
+        heap = self.heap
+        if heap.get_size() < self.k:
+            heap.insert(item)
+        else:
+            heap.pushpop(item)
+
+    def push_many(self, items):
+        """Push every item. Once the heap is full and unkeyed, items
+        are compared against the root inline, and only those that make
+        the cut call into the heap."""
+        items = iter(items)
+        for item in items:
+            self.push(item)
+            if self.key is None and len(self) == self.k:
+                break
+        else:
+            return
+
+        # full and unkeyed: compare against the root inline
+        storage, pushpop = self.heap.storage, self.heap.pushpop
+        for item in items:
+            if storage[0] < item:
+                pushpop(item)
+
+    def result(self):
+        """The kept items, largest first."""
+        ranks = self.heap.get_priorities()
+        order = sorted(range(len(ranks)), key=ranks.__getitem__, reverse=True)
+        return [self.heap.storage[i] for i in order]
@@ -1,6 +1,8 @@
 """Each ListNode holds a reference to its previous node
 as well as its next node in the List."""
 class ListNode:
+  __slots__ = ('value', 'prev', 'next')  # no per-node __dict__
+
   def __init__(self, value, prev=None, next=None):
     self.value = value
     self.prev = prev
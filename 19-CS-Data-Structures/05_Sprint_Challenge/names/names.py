@@ -68,11 +68,13 @@ print(
 )
 
 ## best solution
-from binary_search_tree import BinarySearchTreeNode
+# RedBlackTree has the same interface as BinarySearchTreeNode but stays
+# balanced, so sorted input can't degrade it to a linked list
+from red_black_tree import RedBlackTree
 
 start_time = time.time()
 
-BST = BinarySearchTreeNode(names_1[0])
+BST = RedBlackTree(names_1[0])
 for name in names_1[1:]:
     BST.insert(name)
 
@@ -84,7 +86,7 @@ for name in names_2:
 end_time = time.time()
 
 print(
-    "---- Merge Sort ----", 
+    "---- Red-Black Tree ----", 
     f"{len(duplicates)} duplicates:",
     f"{', '.join(duplicates)}",
     f"runtime: {end_time - start_time} seconds",
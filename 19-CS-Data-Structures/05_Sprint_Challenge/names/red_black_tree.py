@@ -0,0 +1,185 @@
+import binary_search_tree as bst
+
+
+class RedBlackNode:
+    __slots__ = ('value', 'left', 'right', 'parent', 'red', 'size')
+
+    def __init__(self, value, parent=None, red=True):
+        self.value = value
+        self.left = None
+        self.right = None
+        self.parent = parent
+        self.red = red
+        self.size = 1  # number of values in this subtree
+
+
+class RedBlackTree:
+    """Self-balancing binary search tree with the same insert/contains/
+    get_max/for_each interface as BinarySearchTreeNode, so callers can
+    swap `BinarySearchTreeNode(value)` for `RedBlackTree(value)`.
+
+    Recoloring and rotations after each insert keep the height below
+    2 * log2(n + 1), so every operation is O(log n) even on sorted
+    input. Duplicate values are kept, as in BinarySearchTreeNode."""
+    def __init__(self, value=None):
+        self.root = None
+        self.size = 0
+        if value is not None:
+            self.insert(value)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        return bst.in_order(self.root)
+
+    def insert(self, value):
+        parent = None
+        current = self.root
+        while current:
+            current.size += 1
+            parent = current
+            current = current.left if value < current.value else current.right
+
+        node = RedBlackNode(value, parent)
+        if not parent:
+            self.root = node
+        elif value < parent.value:
+            parent.left = node
+        else:
+            parent.right = node
+        self.size += 1
+        self._fix_insert(node)
+
+    def contains(self, target):
+        current = self.root
+        while current:
+            if current.value == target:
+                return True
+            elif target < current.value:
+                current = current.left
+            else:
+                current = current.right
+        return False
+
+    def get_max(self):
+        if not self.root:
+            return None
+
+        current = self.root
+        while current.right:
+            current = current.right
+        return current.value
+
+    def for_each(self, cb):
+        # pre-order, like BinarySearchTreeNode.for_each
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            cb(node.value)
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+
+    def height(self):
+        """Number of edges on the longest root-to-leaf path."""
+        height = -1
+        level = [self.root] if self.root else []
+        while level:
+            height += 1
+            level = [child for node in level
+                     for child in (node.left, node.right) if child]
+        return height
+
+    # ordered-map operations, shared with BinarySearchTreeNode
+    def in_order(self):
+        return bst.in_order(self.root)
+
+    def reverse_order(self):
+        return bst.reverse_order(self.root)
+
+    def range(self, lo, hi):
+        return bst.value_range(self.root, lo, hi)
+
+    def rank(self, key):
+        return bst.rank(self.root, key)
+
+    def select(self, k):
+        return bst.select(self.root, k)
+
+    def floor(self, key):
+        return bst.floor(self.root, key)
+
+    def ceiling(self, key):
+        return bst.ceiling(self.root, key)
+
+    def _fix_insert(self, node):
+        # a red node may not have a red parent; push the violation up
+        # by recoloring, or end it with at most two rotations
+        while node.parent and node.parent.red:
+            parent = node.parent
+            grandparent = parent.parent  # exists, a red node isn't the root
+            if parent is grandparent.left:
+                uncle = grandparent.right
+                if uncle and uncle.red:
+                    parent.red = uncle.red = False
+                    grandparent.red = True
+                    node = grandparent
+                    continue
+                if node is parent.right:
+                    self._rotate_left(parent)
+                    node, parent = parent, node
+                parent.red = False
+                grandparent.red = True
+                self._rotate_right(grandparent)
+            else:
+                uncle = grandparent.left
+                if uncle and uncle.red:
+                    parent.red = uncle.red = False
+                    grandparent.red = True
+                    node = grandparent
+                    continue
+                if node is parent.left:
+                    self._rotate_right(parent)
+                    node, parent = parent, node
+                parent.red = False
+                grandparent.red = True
+                self._rotate_left(grandparent)
+
+        self.root.red = False
+
+    def _replace_child(self, old, new):
+        new.parent = old.parent
+        if not old.parent:
+            self.root = new
+        elif old is old.parent.left:
+            old.parent.left = new
+        else:
+            old.parent.right = new
+
+    def _rotate_left(self, node):
+        pivot = node.right
+        node.right = pivot.left
+        if pivot.left:
+            pivot.left.parent = node
+        self._replace_child(node, pivot)
+        pivot.left = node
+        node.parent = pivot
+        self._resize(node, pivot)
+
+    def _rotate_right(self, node):
+        pivot = node.left
+        node.left = pivot.right
+        if pivot.right:
+            pivot.right.parent = node
+        self._replace_child(node, pivot)
+        pivot.right = node
+        node.parent = pivot
+        self._resize(node, pivot)
+
+    @staticmethod
+    def _resize(node, pivot):
+        # the pivot takes over node's whole subtree
+        pivot.size = node.size
+        node.size = bst._size(node.left) + bst._size(node.right) + 1